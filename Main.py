@@ -1,16 +1,16 @@
 import argparse
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from analyzer.strength import CalculateStrength, GetStrengthCategory
+import os
+from analyzer.strength import CalculateStrength, GetStrengthCategory, MAX_ANALYZED_LENGTH
 from analyzer.entropy import CalculateEntropy, CalculateCharacterPoolEntropy
+from analyzer.context import BuildAnalysisContext
 from analyzer.patterns import DetectPatterns
-from analyzer.common_passwords import IsCommonPassword
+from analyzer.common_passwords import IsCommonPassword, GetCommonPasswords
 from analyzer.feedback import GenerateFeedback
 from analyzer.generator import GeneratePasswords
-from analyzer.hibp import CheckHIBP
 from analyzer.policy import get_policy, PasswordPolicy
+from api.core import PARALLEL_THRESHOLD, expand_results
 from utils.output_formatter import DisplayResults
 from utils.export import ExportToCSV, ExportToHTML
-from utils.export_pdf import ExportToPDF
 from utils.config import LoadConfig, SaveConfig, ShowConfig, UpdateConfigValue, ResetConfig, InitializeConfig
 
 def Parser():
@@ -161,15 +161,18 @@ def Parser():
     return parser.parse_args()
 
 def LoadPasswordsFromFile(file_path):
-    passwords = []
+    """
+    Load one password per line, skipping blank lines
+    Reads and splits the file in bulk rather than iterating line by line
+    """
+    with open(file_path, "rb") as f:
+        text = f.read().decode("utf-8")
 
-    with open(file_path, "r", encoding="utf-8") as f:
-        for line in f:
-            cleaned = line.strip()
-            if cleaned:
-                passwords.append(cleaned)
+    # Match text-mode universal newlines (\r\n, \r and \n)
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
 
-    return passwords
+    return [password for password in map(str.strip, text.split("\n")) if password]
 
 def GetPassword(args):
     if args.file:
@@ -190,30 +193,53 @@ def GetPassword(args):
 
     raise ValueError("No valid input provided")
 
-def AnalyzePassword(password, check_hibp=False, hibp_timeout=5, policy=None):
+def ApplyHIBPResult(result, hibp_pwned, hibp_count):
+    """
+    Attach HIBP fields to an analysis result, marking failed checks with a count of -1
+    A count of None means the lookup was skipped because the password is on the common list
+    """
+    # If hibp_pwned is None, the check failed (no internet, etc.)
+    if hibp_pwned is None:
+        hibp_pwned = False
+        hibp_count = -1  # -1 indicates check couldn't be performed
+
+    result['hibp_pwned'] = hibp_pwned
+    result['hibp_count'] = hibp_count
+    return result
+
+def ApplyPolicy(result, policy):
+    """Validate an analysis result against a policy and attach the outcome"""
+    is_valid, errors = policy.validate(result['password'], result)
+    result['policy_valid'] = is_valid
+    result['policy_errors'] = errors
+    result['policy_name'] = policy.name
+    return result
+
+def AnalyzePassword(password, check_hibp=False, hibp_timeout=5, policy=None, hibp_skip_common=True):
     """
     Perform comprehensive analysis on a single password
     Returns analysis results as a dictionary
+
+    Common passwords are known to be breached, so with hibp_skip_common the HIBP
+    request is skipped for them and hibp_count is reported as None
     """
-    # Perform all analyses
-    patterns = DetectPatterns(password)
-    is_common = IsCommonPassword(password)
+    # Analysis is bounded to the first MAX_ANALYZED_LENGTH characters,
+    # length and the HIBP check still use the whole password
+    analyzed = password[:MAX_ANALYZED_LENGTH]
 
-    # Check HIBP if requested
-    hibp_pwned = False
-    hibp_count = 0
-    if check_hibp:
-        hibp_pwned, hibp_count = CheckHIBP(password, timeout=hibp_timeout)
-        # If hibp_pwned is None, the check failed (no internet, etc.)
-        if hibp_pwned is None:
-            hibp_pwned = False
-            hibp_count = -1  # -1 indicates check couldn't be performed
+    # Scan the password once and share the result with every analyzer
+    context = BuildAnalysisContext(analyzed)
+
+    # Perform all analyses
+    patterns = DetectPatterns(analyzed)
+    is_common = IsCommonPassword(analyzed, context)
 
-    strength_score = CalculateStrength(password, patterns)
+    # Entropy is shared with the strength score rather than calculated twice
+    entropy = CalculateEntropy(analyzed, context)
+    strength_score = CalculateStrength(analyzed, patterns, context, entropy)
     strength_category = GetStrengthCategory(strength_score)
-    entropy = CalculateEntropy(password)
-    pool_entropy = CalculateCharacterPoolEntropy(password)
-    feedback = GenerateFeedback(password, strength_score, patterns, is_common)
+    pool_entropy = CalculateCharacterPoolEntropy(analyzed, context)
+    feedback = GenerateFeedback(analyzed, strength_score, patterns, is_common, context)
 
     result = {
         'password': password,
@@ -227,67 +253,112 @@ def AnalyzePassword(password, check_hibp=False, hibp_timeout=5, policy=None):
         'feedback': feedback
     }
 
-    # Add HIBP data if checked
+    # Add HIBP data if requested
     if check_hibp:
-        result['hibp_pwned'] = hibp_pwned
-        result['hibp_count'] = hibp_count
+        if is_common and hibp_skip_common:
+            ApplyHIBPResult(result, True, None)
+        else:
+            from analyzer.hibp import CheckHIBP
+
+            hibp_pwned, hibp_count = CheckHIBP(password, timeout=hibp_timeout)
+            ApplyHIBPResult(result, hibp_pwned, hibp_count)
 
     # Validate against policy if provided
     if policy:
-        is_valid, errors = policy.validate(password, result)
-        result['policy_valid'] = is_valid
-        result['policy_errors'] = errors
-        result['policy_name'] = policy.name
+        ApplyPolicy(result, policy)
 
     return result
 
-def AnalyzePasswords(passwords, check_hibp=False, hibp_timeout=5, max_workers=4, policy=None):
+def AnalyzePasswordChunk(passwords):
+    """
+    Analyze a chunk of passwords in a worker process
+    Returns (password, result, error) tuples so one failure doesn't lose the chunk
+    """
+    chunk_results = []
+    for password in passwords:
+        try:
+            chunk_results.append((password, AnalyzePassword(password), None))
+        except Exception as e:
+            chunk_results.append((password, None, str(e)))
+    return chunk_results
+
+def AnalyzePasswords(passwords, check_hibp=False, hibp_timeout=5, max_workers=None, policy=None,
+                     hibp_skip_common=True, hibp_workers=None):
     """
     Analyze multiple passwords and return results
     Uses parallel processing for improved performance on large batches
 
+    HIBP lookups are network-bound, so they are issued first from a thread pool
+    (one request per unique hash prefix). The CPU-bound analyses then run in a
+    process pool so they are not limited by the GIL.
+
     Args:
         passwords: List of passwords to analyze
         check_hibp: Whether to check HIBP database
         hibp_timeout: Timeout for HIBP requests
-        max_workers: Maximum number of parallel workers (default: 4)
+        max_workers: Maximum number of worker processes for analysis (default: CPU count)
         policy: Optional PasswordPolicy for validation
+        hibp_skip_common: Skip HIBP requests for passwords on the common list
+        hibp_workers: Maximum number of concurrent HIBP requests (default: HIBP_BATCH_WORKERS)
     """
-    # For small batches or single passwords, use sequential processing
-    if len(passwords) <= 5:
-        results = []
-        for password in passwords:
-            result = AnalyzePassword(password, check_hibp=check_hibp, hibp_timeout=hibp_timeout, policy=policy)
-            results.append(result)
-        return results
-
-    # For larger batches, use parallel processing
-    results = [None] * len(passwords)  # Pre-allocate to maintain order
-
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all tasks
-        future_to_index = {
-            executor.submit(AnalyzePassword, password, check_hibp, hibp_timeout, policy): idx
-            for idx, password in enumerate(passwords)
-        }
-
-        # Collect results as they complete
-        for future in as_completed(future_to_index):
-            idx = future_to_index[future]
-            try:
-                results[idx] = future.result()
-            except Exception as e:
-                # Log error but continue with other passwords
-                print(f"Error analyzing password {idx + 1}: {e}")
-                # Create error result
-                results[idx] = {
-                    'password': passwords[idx],
-                    'error': str(e),
-                    'strength_score': 0,
-                    'strength_category': 'Error'
-                }
-
-    return results
+    # Duplicates are common in leaked-credential dumps, analyze each distinct password once
+    unique_passwords = list(dict.fromkeys(passwords))
+
+    # Resolve all HIBP lookups up front while the network requests overlap
+    if check_hibp:
+        from analyzer.hibp import CheckHIBPBatch, HIBP_BATCH_WORKERS
+
+        hibp_passwords = unique_passwords
+        if hibp_skip_common:
+            hibp_passwords = [password for password in unique_passwords if not IsCommonPassword(password)]
+        hibp_results = dict(zip(hibp_passwords, CheckHIBPBatch(
+            hibp_passwords, timeout=hibp_timeout, max_workers=hibp_workers or HIBP_BATCH_WORKERS)))
+
+    # Load the common passwords set before any workers start so forked workers inherit it
+    GetCommonPasswords()
+
+    if not max_workers:
+        max_workers = os.cpu_count() or 1
+
+    if max_workers > 1 and len(unique_passwords) >= PARALLEL_THRESHOLD:
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Send passwords in chunks (about 4 per worker) to amortize the pickling round trip
+        chunksize = max(1, len(unique_passwords) // (4 * max_workers))
+        chunks = [unique_passwords[i:i + chunksize] for i in range(0, len(unique_passwords), chunksize)]
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            analyzed = [item for chunk_results in executor.map(AnalyzePasswordChunk, chunks)
+                        for item in chunk_results]
+    else:
+        # Below the threshold, starting a process pool costs more than it saves
+        analyzed = AnalyzePasswordChunk(unique_passwords)
+
+    unique_results = {}
+
+    # HIBP and policy are applied here, policies hold unpicklable validators
+    for password, result, error in analyzed:
+        if error is not None:
+            # Log error but continue with other passwords
+            print(f"Error analyzing password {passwords.index(password) + 1}: {error}")
+            # Create error result
+            result = {
+                'password': password,
+                'error': error,
+                'strength_score': 0,
+                'strength_category': 'Error'
+            }
+        else:
+            if check_hibp:
+                ApplyHIBPResult(result, *hibp_results.get(password, (True, None)))
+
+            if policy:
+                ApplyPolicy(result, policy)
+
+        unique_results[password] = result
+
+    # Expand back to input order, duplicates get their own copy of the result
+    return expand_results(passwords, unique_results)
 
 def Main():
     args = Parser()
@@ -358,8 +429,11 @@ def Main():
     # Perform analysis
     check_hibp = args.check_hibp or config['security'].get('check_hibp', False)
     hibp_timeout = config['security'].get('hibp_timeout', 5)
+    hibp_skip_common = config['security'].get('hibp_skip_common', True)
+    hibp_workers = config['security'].get('hibp_concurrency')
     max_workers = config.get('performance', {}).get('batch_processing_threads', 4)
-    results = AnalyzePasswords(passwords, check_hibp=check_hibp, hibp_timeout=hibp_timeout, max_workers=max_workers, policy=policy)
+    results = AnalyzePasswords(passwords, check_hibp=check_hibp, hibp_timeout=hibp_timeout, max_workers=max_workers,
+                               policy=policy, hibp_skip_common=hibp_skip_common, hibp_workers=hibp_workers)
 
     # Format and display results
     DisplayResults(results, json_output=args.json)
@@ -372,6 +446,9 @@ def Main():
         ExportToHTML(results, args.export_html)
 
     if args.export_pdf:
+        # reportlab is slow to import, only load it when a PDF is requested
+        from utils.export_pdf import ExportToPDF
+
         ExportToPDF(results, args.export_pdf)
     
 if __name__ == "__main__":
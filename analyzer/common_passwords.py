@@ -1,35 +1,111 @@
+# Password Risk Analyser - Analyzer Module
 import os
+import pickle
+import tempfile
+import threading
 
-def LoadCommonPasswords():
+def GetCommonPasswordsPaths():
     """
-    Load common passwords list into a set for O(1) lookup
-    Uses data/common_passwords.txt
+    Get the paths of the common passwords list and its precompiled cache
+    Uses data/common_passwords.txt and data/common_passwords.pkl
     """
-    common_set = set()
-
     # Get the path relative to this file
     current_dir = os.path.dirname(os.path.abspath(__file__))
     data_dir = os.path.join(os.path.dirname(current_dir), "data")
-    file_path = os.path.join(data_dir, "common_passwords.txt")
+    return (os.path.join(data_dir, "common_passwords.txt"),
+            os.path.join(data_dir, "common_passwords.pkl"))
+
+def ParseCommonPasswords(file_path):
+    """
+    Parse a common passwords text file into a frozenset of lowercase entries
+    The file is read and lowercased in one go, skipping comments and empty lines
+    """
+    with open(file_path, "r", encoding="utf-8") as f:
+        text = f.read().lower()
+
+    return frozenset([line for line in map(str.strip, text.split("\n")) if line and line[0] != '#'])
+
+def BuildCommonPasswordsCache(file_path, cache_path):
+    """
+    Parse the text list once and pickle the resulting frozenset to cache_path
+    The pickle is written to a temporary file and renamed into place, so a
+    concurrent or interrupted run never leaves a truncated cache behind.
+    Failing to write the cache (e.g. read-only install) is not an error
+    """
+    common_set = ParseCommonPasswords(file_path)
+
+    try:
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path) or ".", suffix=".tmp")
+    except OSError:
+        return common_set
 
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            for line in f:
-                # Skip comments and empty lines
-                line = line.strip()
-                if line and not line.startswith('#'):
-                    # Store in lowercase for case-insensitive matching
-                    common_set.add(line.lower())
-    except FileNotFoundError:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(common_set, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+
+    return common_set
+
+def LoadCommonPasswords():
+    """
+    Load common passwords list into a frozenset for O(1) lookup
+    Uses the pickled cache when it is newer than data/common_passwords.txt,
+    otherwise rebuilds it from the text file
+    """
+    file_path, cache_path = GetCommonPasswordsPaths()
+
+    try:
+        text_mtime = os.path.getmtime(file_path)
+    except OSError:
+        text_mtime = None
+
+    try:
+        if text_mtime is None or os.path.getmtime(cache_path) >= text_mtime:
+            with open(cache_path, "rb") as f:
+                common_set = pickle.load(f)
+            if isinstance(common_set, frozenset):
+                return common_set
+    except (OSError, pickle.UnpicklingError, EOFError):
+        # Missing or corrupt cache, fall through and rebuild
+        pass
+
+    if text_mtime is None:
         # If file doesn't exist, return empty set
         # This allows the tool to work without the common passwords database
-        pass
+        return frozenset()
 
-    return common_set
+    return BuildCommonPasswordsCache(file_path, cache_path)
+
+# Loaded on first use so importers that never check a password skip the file I/O
+_COMMON_PASSWORDS = None
+_LOAD_LOCK = threading.Lock()
 
-# Cache at module level for performance
-COMMON_PASSWORDS = LoadCommonPasswords()
+def GetCommonPasswords():
+    """Return the common passwords set, loading it on first call"""
+    global _COMMON_PASSWORDS
+    if _COMMON_PASSWORDS is None:
+        with _LOAD_LOCK:
+            if _COMMON_PASSWORDS is None:
+                _COMMON_PASSWORDS = LoadCommonPasswords()
+    return _COMMON_PASSWORDS
 
-def IsCommonPassword(password):
-    """Check if password is in common passwords list (case-insensitive)"""
-    return password.lower() in COMMON_PASSWORDS
+def __getattr__(name):
+    # Keep the COMMON_PASSWORDS module attribute working without loading at import
+    if name == "COMMON_PASSWORDS":
+        return GetCommonPasswords()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def IsCommonPassword(password, context=None):
+    """
+    Check if password is in common passwords list (case-insensitive)
+    An optional AnalysisContext supplies the already lowercased password
+    """
+    # str.lower already takes an ASCII fast path, so lookups stay on str rather
+    # than encoding and translating to bytes (measured slower)
+    password_lower = context.password_lower if context else password.lower()
+    return password_lower in GetCommonPasswords()
@@ -0,0 +1,36 @@
+"""
+Shared per-password analysis context
+Computed once so the individual analyzers don't each rescan the password
+"""
+
+from typing import NamedTuple, Tuple
+from analyzer.entropy import GetCharacterClassMask, GetCharacterCounts
+
+
+class AnalysisContext(NamedTuple):
+    """Password properties shared by the analyzers"""
+    password: str
+    password_lower: str
+    length: int
+    char_counts: Tuple[int, ...]
+    class_mask: int
+
+
+def BuildAnalysisContext(password: str) -> AnalysisContext:
+    """
+    Compute the shared properties of a password
+
+    Args:
+        password: Password to analyze
+
+    Returns:
+        AnalysisContext with the lowercased password, length,
+        per-character counts and character class mask
+    """
+    return AnalysisContext(
+        password=password,
+        password_lower=password.lower(),
+        length=len(password),
+        char_counts=tuple(GetCharacterCounts(password)),
+        class_mask=GetCharacterClassMask(password)
+    )
@@ -1,37 +1,136 @@
+from bisect import bisect_right
 import math
 from collections import Counter
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence
 
-def CalculateEntropy(password: str) -> float:
+if TYPE_CHECKING:
+    from analyzer.context import AnalysisContext
+
+# Character class bits, OR'd together into a per-password mask
+CLASS_LOWER = 1
+CLASS_UPPER = 2
+CLASS_DIGIT = 4
+CLASS_SYMBOL = 8
+CLASS_ALL = CLASS_LOWER | CLASS_UPPER | CLASS_DIGIT | CLASS_SYMBOL
+
+def _CharacterClass(char: str) -> int:
+    """Return the class bits for a single character"""
+    bits = 0
+    if char.islower(): bits |= CLASS_LOWER
+    if char.isupper(): bits |= CLASS_UPPER
+    if char.isdigit(): bits |= CLASS_DIGIT
+    if not char.isalnum(): bits |= CLASS_SYMBOL
+    return bits
+
+# Class bit for every ASCII byte, used with bytes.translate for a single C-level pass
+CLASS_LUT = bytes(_CharacterClass(chr(b)) if b < 128 else 0 for b in range(256))
+
+def GetCharacterClassMask(password: str) -> int:
+    """
+    Scan the password once and return the OR of the class bits of its characters
+    ASCII passwords are classified via CLASS_LUT, others fall back to str methods
+    and stop once every class has been seen
+    """
+    mask = 0
+    if password.isascii():
+        for bit in set(password.encode('ascii').translate(CLASS_LUT)):
+            mask |= bit
+    else:
+        for char in set(password):
+            mask |= _CharacterClass(char)
+            if mask == CLASS_ALL:
+                # No further character can add a class
+                break
+    return mask
+
+def HasLower(mask: int) -> bool:
+    """Check whether a class mask includes lowercase letters"""
+    return bool(mask & CLASS_LOWER)
+
+def HasUpper(mask: int) -> bool:
+    """Check whether a class mask includes uppercase letters"""
+    return bool(mask & CLASS_UPPER)
+
+def HasDigit(mask: int) -> bool:
+    """Check whether a class mask includes digits"""
+    return bool(mask & CLASS_DIGIT)
+
+def HasSymbol(mask: int) -> bool:
+    """Check whether a class mask includes symbols"""
+    return bool(mask & CLASS_SYMBOL)
+
+def CountCharacterClasses(mask: int) -> int:
+    """Number of character classes present in a mask"""
+    return bin(mask).count('1')
+
+# count * log2(count) for the character counts seen in typical passwords
+_COUNT_LOG_TABLE_SIZE = 128
+_COUNT_LOG_TABLE = [0.0] + [count * math.log2(count) for count in range(1, _COUNT_LOG_TABLE_SIZE + 1)]
+
+def GetCharacterCounts(password: str) -> List[int]:
+    """Return the occurrence count of each distinct character in the password"""
+    if len(password) <= _COUNT_LOG_TABLE_SIZE:
+        # Short passwords: count each distinct character with str.count (a C loop)
+        return list(map(password.count, set(password)))
+    return list(Counter(password).values())
+
+def EntropyFromCounts(length: int, counts: Sequence[int]) -> float:
+    """
+    Shannon entropy in total bits from character counts
+    Total bits = length * H, which simplifies to
+    length * log2(length) - Σ(count * log2(count))
+    """
+    if not length:
+        return 0.0
+
+    total_entropy = length * math.log2(length)
+    total_entropy -= sum([
+        _COUNT_LOG_TABLE[count] if count <= _COUNT_LOG_TABLE_SIZE else count * math.log2(count)
+        for count in counts
+    ])
+
+    return round(total_entropy, 2)
+
+def CalculateEntropy(password: str, context: Optional["AnalysisContext"] = None) -> float:
     """
     Calculate Shannon entropy: H = -Σ(p(x) * log2(p(x)))
     Returns bits of entropy
     """
+    if context is not None:
+        return EntropyFromCounts(context.length, context.char_counts)
+
     if not password:
         return 0.0
 
-    # Count character frequencies
-    counter = Counter(password)
-    length = len(password)
+    return EntropyFromCounts(len(password), GetCharacterCounts(password))
 
-    # Calculate Shannon entropy
-    entropy = 0.0
-    for count in counter.values():
-        probability = count / length
-        entropy -= probability * math.log2(probability)
+def CalculateEntropyBatch(passwords: List[str]) -> List[float]:
+    """
+    Calculate Shannon entropy for a list of passwords
+    Duplicate passwords are only computed once
+    """
+    computed: Dict[str, float] = {}
+    entropies = []
 
-    # Multiply by length to get total bits
-    total_entropy = entropy * length
+    for password in passwords:
+        entropy = computed.get(password)
+        if entropy is None:
+            entropy = computed[password] = CalculateEntropy(password)
+        entropies.append(entropy)
 
-    return round(total_entropy, 2)
+    return entropies
 
-def CalculateCharacterPoolEntropy(password: str) -> float:
+def CalculateCharacterPoolEntropy(password: str, context: Optional["AnalysisContext"] = None) -> float:
     """
     Calculate entropy based on character pool size
     Formula: log2(pool_size^length) = length * log2(pool_size)
     """
-    pool_size = GetCharacterPoolSize(password)
-    length = len(password)
+    if context is not None:
+        pool_size = GetCharacterPoolSize(password, context.class_mask)
+        length = context.length
+    else:
+        pool_size = GetCharacterPoolSize(password)
+        length = len(password)
 
     if pool_size == 0 or length == 0:
         return 0.0
@@ -39,25 +138,23 @@ def CalculateCharacterPoolEntropy(password: str) -> float:
     entropy = length * math.log2(pool_size)
     return round(entropy, 2)
 
-def GetCharacterPoolSize(password: str) -> int:
+def GetCharacterPoolSize(password: str, mask: Optional[int] = None) -> int:
     """Determine character pool size based on character types used"""
-    has_lowercase = any(c.islower() for c in password)
-    has_uppercase = any(c.isupper() for c in password)
-    has_digits = any(c.isdigit() for c in password)
-    has_symbols = any(not c.isalnum() for c in password)
+    if mask is None:
+        mask = GetCharacterClassMask(password)
 
     pool_size = 0
-    if has_lowercase: pool_size += 26
-    if has_uppercase: pool_size += 26
-    if has_digits: pool_size += 10
-    if has_symbols: pool_size += 32  # Common symbols
+    if HasLower(mask): pool_size += 26
+    if HasUpper(mask): pool_size += 26
+    if HasDigit(mask): pool_size += 10
+    if HasSymbol(mask): pool_size += 32  # Common symbols
 
     return pool_size
 
+# Lower bound of each category above "Very Weak", searched with bisect
+ENTROPY_THRESHOLDS = (28, 40, 60, 80)
+ENTROPY_CATEGORIES = ("Very Weak", "Weak", "Moderate", "Strong", "Excellent")
+
 def GetEntropyCategory(entropy: float) -> str:
     """Categorize entropy strength"""
-    if entropy >= 80: return "Excellent"
-    if entropy >= 60: return "Strong"
-    if entropy >= 40: return "Moderate"
-    if entropy >= 28: return "Weak"
-    return "Very Weak"
+    return ENTROPY_CATEGORIES[bisect_right(ENTROPY_THRESHOLDS, entropy)]
@@ -1,7 +1,10 @@
-def GenerateFeedback(password, strength_score, patterns, is_common):
+from analyzer.entropy import GetCharacterClassMask, HasLower, HasUpper, HasDigit, HasSymbol, CountCharacterClasses
+
+def GenerateFeedback(password, strength_score, patterns, is_common, context=None):
     """
     Generate specific, actionable feedback for password improvement
     Returns list of feedback messages ordered by priority
+    An optional AnalysisContext avoids rescanning the password
     """
     feedback = []
 
@@ -10,15 +13,17 @@ def GenerateFeedback(password, strength_score, patterns, is_common):
         feedback.append("CRITICAL: This password appears in common password lists and is easily guessable.")
 
     # Length issues
-    if len(password) < 8:
+    length = context.length if context else len(password)
+    if length < 8:
         feedback.append("Your password is too short. Use at least 12 characters for better security.")
-    elif len(password) < 12:
+    elif length < 12:
         feedback.append("Consider using at least 12 characters for improved security.")
 
     # Character diversity issues
-    char_types = GetCharacterTypes(password)
+    mask = context.class_mask if context else GetCharacterClassMask(password)
+    char_types = GetCharacterTypes(password, mask)
     if char_types < 3:
-        missing = GetMissingCharacterTypes(password)
+        missing = GetMissingCharacterTypes(password, mask)
         if missing:
             feedback.append(f"Add {', '.join(missing)} to increase password complexity.")
 
@@ -47,20 +52,19 @@ def GenerateFeedback(password, strength_score, patterns, is_common):
 
     return feedback
 
-def GetCharacterTypes(password):
+def GetCharacterTypes(password, mask=None):
     """Count number of character type categories used"""
-    types = 0
-    if any(c.islower() for c in password): types += 1
-    if any(c.isupper() for c in password): types += 1
-    if any(c.isdigit() for c in password): types += 1
-    if any(not c.isalnum() for c in password): types += 1
-    return types
+    if mask is None:
+        mask = GetCharacterClassMask(password)
+    return CountCharacterClasses(mask)
 
-def GetMissingCharacterTypes(password):
+def GetMissingCharacterTypes(password, mask=None):
     """Return list of missing character types"""
+    if mask is None:
+        mask = GetCharacterClassMask(password)
     missing = []
-    if not any(c.islower() for c in password): missing.append("lowercase letters")
-    if not any(c.isupper() for c in password): missing.append("uppercase letters")
-    if not any(c.isdigit() for c in password): missing.append("numbers")
-    if not any(not c.isalnum() for c in password): missing.append("symbols")
+    if not HasLower(mask): missing.append("lowercase letters")
+    if not HasUpper(mask): missing.append("uppercase letters")
+    if not HasDigit(mask): missing.append("numbers")
+    if not HasSymbol(mask): missing.append("symbols")
     return missing
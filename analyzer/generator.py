@@ -1,61 +1,125 @@
+import functools
 import secrets
 import string
 
-def GeneratePassword(length=16, use_uppercase=True, use_lowercase=True,
-                     use_digits=True, use_symbols=True):
+def _RandomByteStream(block_size):
     """
-    Generate a cryptographically secure random password
+    Yield cryptographically secure random bytes
+    Bytes are drawn from the OS CSPRNG in blocks rather than one call per character
+    """
+    while True:
+        yield from secrets.token_bytes(block_size)
 
-    Args:
-        length: Password length (default 16)
-        use_uppercase: Include uppercase letters (default True)
-        use_lowercase: Include lowercase letters (default True)
-        use_digits: Include numbers (default True)
-        use_symbols: Include symbols (default True)
+def _RandomBelow(n, stream):
+    """
+    Return a uniform random integer in [0, n) using bytes from stream
+    Uses rejection sampling against the next power of two to avoid modulo bias
+    """
+    if n > 256:
+        return secrets.randbelow(n)
 
-    Returns:
-        Generated password string
+    mask = (1 << (n - 1).bit_length()) - 1
+    for byte in stream:
+        value = byte & mask
+        if value < n:
+            return value
+
+@functools.lru_cache(maxsize=16)
+def _BuildByteTables(char_pool):
     """
-    if length < 4:
-        raise ValueError("Password length must be at least 4 characters")
+    Build bytes.translate tables mapping a random byte to a pool character
+    Bytes are masked to the next power of two above the pool size, bytes whose
+    masked value falls outside the pool are listed for deletion (rejected)
+    """
+    pool_size = len(char_pool)
+    mask = (1 << (pool_size - 1).bit_length()) - 1
+    table = bytes(ord(char_pool[b & mask]) if (b & mask) < pool_size else 0 for b in range(256))
+    rejected = bytes(b for b in range(256) if (b & mask) >= pool_size)
+    return table, rejected
 
-    # Build character pool
-    char_pool = ""
-    required_chars = []
+def _RandomPoolChars(count, tables):
+    """
+    Draw count uniformly random pool characters
+    Rejection sampling and mapping both run inside bytes.translate
+    """
+    table, rejected = tables
+    chars = b''
+    while len(chars) < count:
+        # At least half of all bytes are accepted, so request twice what is missing
+        chars += secrets.token_bytes((count - len(chars)) * 2).translate(table, rejected)
+    return chars[:count].decode('ascii')
+
+def _BuildCharacterClasses(use_uppercase, use_lowercase, use_digits, use_symbols):
+    """Return the enabled character classes, raising if none are enabled"""
+    char_classes = []
 
     if use_lowercase:
-        char_pool += string.ascii_lowercase
-        required_chars.append(secrets.choice(string.ascii_lowercase))
+        char_classes.append(string.ascii_lowercase)
 
     if use_uppercase:
-        char_pool += string.ascii_uppercase
-        required_chars.append(secrets.choice(string.ascii_uppercase))
+        char_classes.append(string.ascii_uppercase)
 
     if use_digits:
-        char_pool += string.digits
-        required_chars.append(secrets.choice(string.digits))
+        char_classes.append(string.digits)
 
     if use_symbols:
-        char_pool += string.punctuation
-        required_chars.append(secrets.choice(string.punctuation))
+        char_classes.append(string.punctuation)
 
-    if not char_pool:
+    if not char_classes:
         raise ValueError("At least one character type must be enabled")
 
-    # Generate remaining characters
-    remaining_length = length - len(required_chars)
-    if remaining_length < 0:
-        # If length is too short for all required chars, just use the pool
-        password_chars = [secrets.choice(char_pool) for _ in range(length)]
+    return char_classes
+
+def _FillLength(length, char_classes):
+    """Number of pool characters a password needs besides one per required class"""
+    remaining_length = length - len(char_classes)
+    # If length is too short for all required chars, the whole password comes from the pool
+    return remaining_length if remaining_length >= 0 else length
+
+def _GenerateFromClasses(length, char_classes, stream, fill_chars):
+    """
+    Generate one password with at least one character from each class
+    fill_chars holds the _FillLength(length, char_classes) random pool characters
+    """
+    if length < len(char_classes):
+        password_chars = list(fill_chars)
     else:
         # Ensure at least one of each required type, then fill the rest randomly
-        password_chars = required_chars + [secrets.choice(char_pool) for _ in range(remaining_length)]
+        password_chars = [chars[_RandomBelow(len(chars), stream)] for chars in char_classes]
+        password_chars += fill_chars
+
+    # Fisher-Yates shuffle to avoid predictable patterns
+    for i in range(len(password_chars) - 1, 0, -1):
+        j = _RandomBelow(i + 1, stream)
+        password_chars[i], password_chars[j] = password_chars[j], password_chars[i]
 
-    # Shuffle to avoid predictable patterns
-    password_list = list(password_chars)
-    secrets.SystemRandom().shuffle(password_list)
+    return ''.join(password_chars)
 
-    return ''.join(password_list)
+def GeneratePassword(length=16, use_uppercase=True, use_lowercase=True,
+                     use_digits=True, use_symbols=True):
+    """
+    Generate a cryptographically secure random password
+
+    Args:
+        length: Password length (default 16)
+        use_uppercase: Include uppercase letters (default True)
+        use_lowercase: Include lowercase letters (default True)
+        use_digits: Include numbers (default True)
+        use_symbols: Include symbols (default True)
+
+    Returns:
+        Generated password string
+    """
+    if length < 4:
+        raise ValueError("Password length must be at least 4 characters")
+
+    char_classes = _BuildCharacterClasses(use_uppercase, use_lowercase, use_digits, use_symbols)
+    tables = _BuildByteTables("".join(char_classes))
+
+    # Required characters + shuffle need roughly 2 * length bytes after rejections
+    stream = _RandomByteStream(length * 2)
+    fill_chars = _RandomPoolChars(_FillLength(length, char_classes), tables)
+    return _GenerateFromClasses(length, char_classes, stream, fill_chars)
 
 def GeneratePasswords(count=1, length=16, use_uppercase=True, use_lowercase=True,
                       use_digits=True, use_symbols=True):
@@ -79,10 +143,18 @@ def GeneratePasswords(count=1, length=16, use_uppercase=True, use_lowercase=True
     if count > 100:
         raise ValueError("Cannot generate more than 100 passwords at once")
 
-    passwords = []
-    for _ in range(count):
-        password = GeneratePassword(length, use_uppercase, use_lowercase,
-                                   use_digits, use_symbols)
-        passwords.append(password)
+    if length < 4:
+        raise ValueError("Password length must be at least 4 characters")
 
-    return passwords
+    char_classes = _BuildCharacterClasses(use_uppercase, use_lowercase, use_digits, use_symbols)
+    tables = _BuildByteTables("".join(char_classes))
+
+    # One random byte stream shared by the whole batch, and the pool characters
+    # for every password drawn in a single call then sliced
+    stream = _RandomByteStream(count * length * 2)
+    fill_length = _FillLength(length, char_classes)
+    fill_chars = _RandomPoolChars(count * fill_length, tables)
+    return [
+        _GenerateFromClasses(length, char_classes, stream, fill_chars[i * fill_length:(i + 1) * fill_length])
+        for i in range(count)
+    ]
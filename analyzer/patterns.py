@@ -1,19 +1,25 @@
 import re
 import os
+from functools import lru_cache
 from typing import List, Dict, Set
 
 # Compiled regex patterns for performance
-REPEATED_CHARS_PATTERN = re.compile(r'(.)\1{2,}')
-DATE_PATTERNS = [
-    re.compile(r'19\d{2}'),           # 1900-1999
-    re.compile(r'20[0-2]\d'),         # 2000-2029
-    re.compile(r'\d{2}[/-]\d{2}[/-]\d{2,4}'),  # DD/MM/YY or DD-MM-YYYY
-    re.compile(r'\d{4}[/-]\d{2}[/-]\d{2}'),    # YYYY/MM/DD
-    re.compile(r'\d{8}'),             # YYYYMMDD or MMDDYYYY or DDMMYYYY (8 digits)
-    re.compile(r'(0[1-9]|[12][0-9]|3[01])'),  # Day 01-31
-    re.compile(r'(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)', re.IGNORECASE),  # Month names (short)
-    re.compile(r'(january|february|march|april|may|june|july|august|september|october|november|december)', re.IGNORECASE)  # Month names (full)
-]
+# Outer group captures the whole run so findall returns it directly
+REPEATED_CHARS_PATTERN = re.compile(r'((.)\2{2,})')
+# Date alternatives fused into one pattern so the password is scanned once.
+# Longer forms come first so they win over the years and days they contain.
+# The lookahead rejects positions that can't start any alternative (a digit or
+# a month initial) before the engine tries each branch in turn
+DATE_PATTERN = re.compile(r'(?=[\dadfjmnos])(?:' + '|'.join([
+    r'\d{4}[/-]\d{2}[/-]\d{2}',    # YYYY/MM/DD
+    r'\d{2}[/-]\d{2}[/-]\d{2,4}',  # DD/MM/YY or DD-MM-YYYY
+    r'\d{8}',                      # YYYYMMDD or MMDDYYYY or DDMMYYYY (8 digits)
+    r'19\d{2}',                    # 1900-1999
+    r'20[0-2]\d',                  # 2000-2029
+    r'(?:january|february|march|april|may|june|july|august|september|october|november|december)',  # Month names (full)
+    r'(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)',  # Month names (short)
+    r'(?:0[1-9]|[12][0-9]|3[01])'   # Day 01-31
+]) + ')', re.IGNORECASE)
 
 def LoadCommonWords() -> Set[str]:
     """Load common words from external file"""
@@ -50,24 +56,138 @@ def DetectPatterns(password: str) -> Dict[str, List[str]]:
         'context_patterns': [list of context-specific patterns]
     }
     """
-    patterns = {
-        'sequences': DetectSequences(password),
-        'keyboard_walks': DetectKeyboardWalks(password),
-        'repeated_chars': DetectRepeatedChars(password),
-        'dates': DetectDatePatterns(password),
-        'common_words': DetectCommonWords(password),
-        'leetspeak': DetectLeetspeak(password),
-        'context_patterns': DetectContextPatterns(password)
-    }
+    # Callers get their own lists, the memoized result stays immutable
+    return {key: list(found) for key, found in zip(PATTERN_KEYS, _DetectPatternsCached(password))}
+
+PATTERN_KEYS = ('sequences', 'keyboard_walks', 'repeated_chars', 'dates',
+                'common_words', 'leetspeak', 'context_patterns')
+
+@lru_cache(maxsize=65536)
+def _DetectPatternsCached(password):
+    """
+    Run every detector over the password, memoized per process
+    The cache keeps up to 65536 plaintext passwords alive, so long-running
+    processes (e.g. the web app) call ClearPatternCache after each request
+    """
+    password_lower = password.lower()
+    return (
+        tuple(DetectSequences(password, password_lower)),
+        tuple(DetectKeyboardWalks(password, password_lower)),
+        tuple(DetectRepeatedChars(password)),
+        tuple(DetectDatePatterns(password)),
+        tuple(DetectCommonWords(password, password_lower)),
+        tuple(DetectLeetspeak(password, password_lower)),
+        tuple(DetectContextPatterns(password, password_lower))
+    )
+
+def ClearPatternCache():
+    """
+    Drop pattern results memoized in this process, e.g. after changing
+    COMMON_WORDS or once a request no longer needs its passwords
+    """
+    _DetectPatternsCached.cache_clear()
 
-    return patterns
+def DetectPatternsBatch(passwords: List[str]) -> List[Dict[str, List[str]]]:
+    """
+    Run DetectPatterns over a list of passwords
+    Each detector is mapped over the distinct passwords in turn, duplicates
+    get their own copy of the result
+    """
+    unique_passwords = list(dict.fromkeys(passwords))
+    detectors = (
+        ('sequences', DetectSequences),
+        ('keyboard_walks', DetectKeyboardWalks),
+        ('repeated_chars', DetectRepeatedChars),
+        ('dates', DetectDatePatterns),
+        ('common_words', DetectCommonWords),
+        ('leetspeak', DetectLeetspeak),
+        ('context_patterns', DetectContextPatterns)
+    )
+
+    keys = [key for key, _ in detectors]
+    columns = [list(map(detector, unique_passwords)) for _, detector in detectors]
+    computed = {password: dict(zip(keys, row)) for password, row in zip(unique_passwords, zip(*columns))}
 
-def DetectSequences(password):
+    results = []
+    seen = set()
+    for password in passwords:
+        patterns = computed[password]
+        if password in seen:
+            patterns = {key: list(value) for key, value in patterns.items()}
+        seen.add(password)
+        results.append(patterns)
+
+    return results
+
+# Byte class of each ASCII character for the sequence scan: digits 1, letters 2, others 0
+SEQUENCE_CLASS_DIGIT = 1
+SEQUENCE_CLASS_ALPHA = 2
+SEQUENCE_CLASS_TABLE = bytes(
+    SEQUENCE_CLASS_DIGIT if chr(b).isdigit() else SEQUENCE_CLASS_ALPHA if chr(b).isalpha() else 0
+    for b in range(128)
+) + bytes(128)
+
+# Byte successor and predecessor tables for the sequence scan
+SEQUENCE_NEXT_TABLE = bytes((b + 1) & 0xFF for b in range(256))
+SEQUENCE_PREV_TABLE = bytes((b - 1) & 0xFF for b in range(256))
+
+def _DoubleStepStarts(diff):
+    """Return every index where diff has two consecutive zero bytes"""
+    starts = []
+    i = diff.find(b'\0\0')
+    while i != -1:
+        starts.append(i)
+        i = diff.find(b'\0\0', i + 1)
+    return starts
+
+def _SequenceStarts(data, classes):
+    """
+    Return the start index of every 3-character run stepping by +1 or -1
+    within a single character class
+
+    Each byte is XOR'd (as one big integer) against its predecessor shifted by
+    +1 or -1, so a zero byte marks a matching step. Two zero bytes in a row mark
+    a 3-character run, found with bytes.find instead of a per-position loop
+    """
+    length = len(data)
+    if length < 3:
+        return []
+
+    following = int.from_bytes(data[1:], 'big')
+    preceding = data[:-1]
+    ascending = following ^ int.from_bytes(preceding.translate(SEQUENCE_NEXT_TABLE), 'big')
+    descending = following ^ int.from_bytes(preceding.translate(SEQUENCE_PREV_TABLE), 'big')
+
+    starts = _DoubleStepStarts(ascending.to_bytes(length - 1, 'big'))
+    starts += _DoubleStepStarts(descending.to_bytes(length - 1, 'big'))
+    starts.sort()
+
+    return [i for i in starts if classes[i] and classes[i] == classes[i + 1] == classes[i + 2]]
+
+def DetectSequences(password, password_lower=None):
     """
     Detect sequential patterns: 123, abc, 987, zyx
+    password_lower can be passed when the caller has already lowercased it
     """
+    if password_lower is None:
+        password_lower = password.lower()
+
+    if not password.isascii():
+        return _DetectSequencesUnicode(password, password_lower)
+
+    # ASCII digits and letters are contiguous, so code point steps equal value steps
+    data = password_lower.encode('ascii')
+    classes = data.translate(SEQUENCE_CLASS_TABLE)
+    starts = _SequenceStarts(data, classes)
+
+    # Numeric sequences are reported before alphabetic ones
+    sequences_found = [password[i:i+3] for i in starts if classes[i] == SEQUENCE_CLASS_DIGIT]
+    sequences_found += [password[i:i+3] for i in starts if classes[i] == SEQUENCE_CLASS_ALPHA]
+    return sequences_found
+
+def _DetectSequencesUnicode(password, password_lower):
+    """Sequence detection for non-ASCII passwords"""
     sequences_found = []
-    password_lower = password.lower()
 
     # Check numeric sequences (123, 987)
     for i in range(len(password) - 2):
@@ -91,127 +211,125 @@ def DetectSequences(password):
 
     return sequences_found
 
-def DetectKeyboardWalks(password):
+KEYBOARD_LAYOUTS = [
+    # Standard rows
+    'qwertyuiop',
+    'asdfghjkl',
+    'zxcvbnm',
+    '1234567890',
+    # Diagonal patterns
+    '1qaz2wsx3edc',
+    '1q2w3e4r',
+    'zaq12wsx',
+    'xsw23edc',
+    'zaqxswcdevfr',
+    # Vertical patterns
+    'qazwsx',
+    'qweasd',
+    'qweasdzxc',
+    'zaqxswcde',
+    # Additional patterns
+    'plmoknijb',
+    'zaq12wsx23edc',
+    # Numpad patterns
+    '789456123',
+    '741852963',
+    '987654321'
+]
+
+def BuildKeyboardWalkGrams(layouts):
+    """Return every forward and backward 4 character run of the keyboard layouts"""
+    grams = set()
+    for layout in layouts:
+        for direction in (layout, layout[::-1]):
+            for i in range(len(direction) - 3):
+                grams.add(direction[i:i+4])
+    return frozenset(grams)
+
+# All keyboard walk 4-grams, built once at import
+KEYBOARD_WALK_GRAMS = BuildKeyboardWalkGrams(KEYBOARD_LAYOUTS)
+
+def DetectKeyboardWalks(password, password_lower=None):
     """
     Detect keyboard patterns: qwerty, asdfgh, 1qaz, etc.
     Enhanced with additional diagonal and vertical patterns
     """
-    keyboard_layouts = [
-        # Standard rows
-        'qwertyuiop',
-        'asdfghjkl',
-        'zxcvbnm',
-        '1234567890',
-        # Diagonal patterns
-        '1qaz2wsx3edc',
-        '1q2w3e4r',
-        'zaq12wsx',
-        'xsw23edc',
-        'zaqxswcdevfr',
-        # Vertical patterns
-        'qazwsx',
-        'qweasd',
-        'qweasdzxc',
-        'zaqxswcde',
-        # Additional patterns
-        'plmoknijb',
-        'zaq12wsx23edc',
-        # Numpad patterns
-        '789456123',
-        '741852963',
-        '987654321'
-    ]
-
-    walks_found = []
-    password_lower = password.lower()
+    walks_found = {}
+    seen_grams = set()
+    if password_lower is None:
+        password_lower = password.lower()
 
-    for layout in keyboard_layouts:
-        # Check forward and backward
-        for direction in [layout, layout[::-1]]:
-            for i in range(len(direction) - 3):
-                pattern = direction[i:i+4]
-                if pattern in password_lower:
-                    # Find the actual case-sensitive match
-                    start_idx = password_lower.find(pattern)
-                    walks_found.append(password[start_idx:start_idx+4])
+    for i in range(len(password_lower) - 3):
+        gram = password_lower[i:i+4]
+        if gram in KEYBOARD_WALK_GRAMS and gram not in seen_grams:
+            # Report the case-sensitive text of the first occurrence only
+            seen_grams.add(gram)
+            walks_found[password[i:i+4]] = None
 
-    return list(set(walks_found))  # Remove duplicates
+    return list(walks_found)
 
 def DetectRepeatedChars(password):
     """
     Detect repeated characters: aaa, 111, !!!!
     """
-    repeated = REPEATED_CHARS_PATTERN.findall(password)
-    # Return the actual repeated segments
-    results = []
-    for match in repeated:
-        # Find all occurrences of this repeated character (3+ times)
-        pattern = re.compile(re.escape(match) + r'{3,}')
-        matches = pattern.findall(password)
-        results.extend(matches)
-    return list(set(results))  # Remove duplicates
+    runs = REPEATED_CHARS_PATTERN.findall(password)
+    if not runs:
+        return []
+    # Each match is already a whole run, keep the first occurrence of each
+    return list(dict.fromkeys([run for run, _ in runs]))
 
 def DetectDatePatterns(password):
     """
     Detect date patterns: 1990, 2023, 19/01, 01-01-2000
     """
-    dates_found = []
-    for pattern in DATE_PATTERNS:
-        matches = pattern.findall(password)
-        dates_found.extend(matches)
+    return DATE_PATTERN.findall(password)
 
-    return dates_found
+def FindWords(text, words):
+    """
+    Return the words that occur as substrings of text
+    With dictionaries this small, one C-level substring search per word beats
+    building per-password n-gram sets, a pure Python automaton or a dict trie
+    walked from every offset. A trigram
+    prefilter only pays off for the context list on passwords with no hits and
+    costs up to 3x more on the rest, so none is applied
+    """
+    return [word for word in words if word in text]
 
-def DetectCommonWords(password):
+def DetectCommonWords(password, password_lower=None):
     """
     Detect common dictionary words from external file
     """
-    found_words = []
-    password_lower = password.lower()
-
-    for word in COMMON_WORDS:
-        if word in password_lower:
-            found_words.append(word)
-
-    return found_words
-
-def DetectLeetspeak(password):
+    return FindWords(password.lower() if password_lower is None else password_lower, COMMON_WORDS)
+
+# Mapping of leetspeak characters to their normal equivalents
+LEET_TABLE = str.maketrans({
+    '@': 'a', '4': 'a',
+    '3': 'e',
+    '1': 'i', '!': 'i',
+    '0': 'o',
+    '5': 's', '$': 's',
+    '7': 't',
+    '+': 't',
+    '8': 'b',
+    '9': 'g'
+})
+
+def DetectLeetspeak(password, password_lower=None):
     """
     Detect leetspeak substitutions (e.g., p@ssw0rd, passw0rd)
     Common substitutions: a→@/4, e→3, i→1/!, o→0, s→5/$, t→7
     """
-    # Mapping of leetspeak characters to their normal equivalents
-    leet_map = {
-        '@': 'a', '4': 'a',
-        '3': 'e',
-        '1': 'i', '!': 'i',
-        '0': 'o',
-        '5': 's', '$': 's',
-        '7': 't',
-        '+': 't',
-        '8': 'b',
-        '9': 'g'
-    }
-
     # Convert password by replacing leetspeak characters
-    normalized = []
-    for char in password.lower():
-        if char in leet_map:
-            normalized.append(leet_map[char])
-        else:
-            normalized.append(char)
-
-    normalized_password = ''.join(normalized)
+    if password_lower is None:
+        password_lower = password.lower()
+    normalized_password = password_lower.translate(LEET_TABLE)
 
-    # Check if the normalized version contains common words
-    found_leetspeak = []
-    for word in COMMON_WORDS:
-        if word in normalized_password and word not in password.lower():
-            # The word exists in normalized form but not in original
-            # This means leetspeak was used
-            found_leetspeak.append(word)
+    # Without substitutions every word found would also be in the original
+    if normalized_password == password_lower:
+        return []
 
-    return found_leetspeak
+    # Words in the normalized form but not in the original mean leetspeak was used
+    return [word for word in COMMON_WORDS if word in normalized_password and word not in password_lower]
 
 def LoadContextPatterns():
     """Load context-specific patterns from external file"""
@@ -241,15 +359,8 @@ def LoadContextPatterns():
 # Load context patterns at module level for performance
 CONTEXT_PATTERNS = LoadContextPatterns()
 
-def DetectContextPatterns(password):
+def DetectContextPatterns(password, password_lower=None):
     """
     Detect context-specific patterns: companies, tech terms, sports, pop culture
     """
-    found_patterns = []
-    password_lower = password.lower()
-
-    for word in CONTEXT_PATTERNS:
-        if word in password_lower:
-            found_patterns.append(word)
-
-    return found_patterns
+    return FindWords(password.lower() if password_lower is None else password_lower, CONTEXT_PATTERNS)
@@ -7,11 +7,35 @@ from typing import List, Tuple, Dict, Any, Optional, Set
 import json
 import re
 
+from analyzer.entropy import CLASS_LUT, CLASS_LOWER, CLASS_UPPER, CLASS_DIGIT, CLASS_SYMBOL
+
+
+def count_characters(password: str) -> Tuple[int, int, int, int, int]:
+    """
+    Count a password's characters by class in one pass
+
+    Returns:
+        Tuple of (length, uppercase, lowercase, digits, symbols)
+    """
+    if password.isascii():
+        # ASCII characters fall in exactly one class, so count the translated class bytes
+        classes = password.encode('ascii').translate(CLASS_LUT)
+        return (len(password), classes.count(CLASS_UPPER), classes.count(CLASS_LOWER),
+                classes.count(CLASS_DIGIT), classes.count(CLASS_SYMBOL))
+    # map() over the str methods beats a Counter-then-classify pass for typical lengths
+    return (len(password), sum(map(str.isupper, password)), sum(map(str.islower, password)),
+            sum(map(str.isdigit, password)), len(password) - sum(map(str.isalnum, password)))
+
+
+# Index of each value in the count_characters tuple
+COUNT_LENGTH, COUNT_UPPER, COUNT_LOWER, COUNT_DIGIT, COUNT_SYMBOL = range(5)
+
 
 class PolicyRule:
     """Individual password policy rule"""
 
-    def __init__(self, name: str, description: str, validator, error_message: str):
+    def __init__(self, name: str, description: str, validator, error_message: str,
+                 count_check: Optional[Tuple[int, int, bool]] = None):
         """
         Initialize a policy rule
 
@@ -20,11 +44,14 @@ class PolicyRule:
             description: Rule description
             validator: Validation function that takes password and returns bool
             error_message: Error message when validation fails
+            count_check: Optional (count index, limit, is_maximum) checked against
+                         count_characters() instead of calling the validator
         """
         self.name = name
         self.description = description
         self.validator = validator
         self.error_message = error_message
+        self.count_check = count_check
 
     def validate(self, password: str, analysis_result: Optional[Dict[str, Any]] = None) -> Tuple[bool, str]:
         """
@@ -56,76 +83,78 @@ class PasswordPolicy:
         """
         self.name = name
         self.rules: List[PolicyRule] = []
+        self._compiled = None
+        self._compiled_key = ()
 
     def add_rule(self, rule: PolicyRule):
         """Add a rule to the policy"""
         self.rules.append(rule)
+        self._compiled = None
+
+    def _add_count_rule(self, name: str, description: str, error_message: str,
+                        index: int, limit: int, is_maximum: bool = False):
+        """Add a rule comparing one count_characters() value against a limit"""
+        if is_maximum:
+            validator = lambda pwd, _: count_characters(pwd)[index] <= limit
+        else:
+            validator = lambda pwd, _: count_characters(pwd)[index] >= limit
+        self.add_rule(PolicyRule(name, description, validator, error_message,
+                                 count_check=(index, limit, is_maximum)))
+        return self
 
     def add_min_length(self, min_length: int):
         """Add minimum length requirement"""
-        rule = PolicyRule(
+        return self._add_count_rule(
             name=f"min_length_{min_length}",
             description=f"Minimum {min_length} characters",
-            validator=lambda pwd, _: len(pwd) >= min_length,
-            error_message=f"Password must be at least {min_length} characters long"
+            error_message=f"Password must be at least {min_length} characters long",
+            index=COUNT_LENGTH, limit=min_length
         )
-        self.add_rule(rule)
-        return self
 
     def add_max_length(self, max_length: int):
         """Add maximum length requirement"""
-        rule = PolicyRule(
+        return self._add_count_rule(
             name=f"max_length_{max_length}",
             description=f"Maximum {max_length} characters",
-            validator=lambda pwd, _: len(pwd) <= max_length,
-            error_message=f"Password must not exceed {max_length} characters"
+            error_message=f"Password must not exceed {max_length} characters",
+            index=COUNT_LENGTH, limit=max_length, is_maximum=True
         )
-        self.add_rule(rule)
-        return self
 
     def require_uppercase(self, min_count: int = 1):
         """Require uppercase letters"""
-        rule = PolicyRule(
+        return self._add_count_rule(
             name=f"require_uppercase_{min_count}",
             description=f"At least {min_count} uppercase letter(s)",
-            validator=lambda pwd, _: sum(1 for c in pwd if c.isupper()) >= min_count,
-            error_message=f"Password must contain at least {min_count} uppercase letter(s)"
+            error_message=f"Password must contain at least {min_count} uppercase letter(s)",
+            index=COUNT_UPPER, limit=min_count
         )
-        self.add_rule(rule)
-        return self
 
     def require_lowercase(self, min_count: int = 1):
         """Require lowercase letters"""
-        rule = PolicyRule(
+        return self._add_count_rule(
             name=f"require_lowercase_{min_count}",
             description=f"At least {min_count} lowercase letter(s)",
-            validator=lambda pwd, _: sum(1 for c in pwd if c.islower()) >= min_count,
-            error_message=f"Password must contain at least {min_count} lowercase letter(s)"
+            error_message=f"Password must contain at least {min_count} lowercase letter(s)",
+            index=COUNT_LOWER, limit=min_count
         )
-        self.add_rule(rule)
-        return self
 
     def require_digits(self, min_count: int = 1):
         """Require digits"""
-        rule = PolicyRule(
+        return self._add_count_rule(
             name=f"require_digits_{min_count}",
             description=f"At least {min_count} digit(s)",
-            validator=lambda pwd, _: sum(1 for c in pwd if c.isdigit()) >= min_count,
-            error_message=f"Password must contain at least {min_count} digit(s)"
+            error_message=f"Password must contain at least {min_count} digit(s)",
+            index=COUNT_DIGIT, limit=min_count
         )
-        self.add_rule(rule)
-        return self
 
     def require_symbols(self, min_count: int = 1):
         """Require special symbols"""
-        rule = PolicyRule(
+        return self._add_count_rule(
             name=f"require_symbols_{min_count}",
             description=f"At least {min_count} special symbol(s)",
-            validator=lambda pwd, _: sum(1 for c in pwd if not c.isalnum()) >= min_count,
-            error_message=f"Password must contain at least {min_count} special symbol(s)"
+            error_message=f"Password must contain at least {min_count} special symbol(s)",
+            index=COUNT_SYMBOL, limit=min_count
         )
-        self.add_rule(rule)
-        return self
 
     def add_min_entropy(self, min_entropy: float):
         """Add minimum entropy requirement"""
@@ -204,12 +233,19 @@ class PasswordPolicy:
         """Add blacklisted words that cannot appear in password"""
         words_lower = [w.lower() for w in words]
 
-        def contains_blacklisted(pwd, result):
-            pwd_lower = pwd.lower()
-            for word in words_lower:
-                if word in pwd_lower:
-                    return False
-            return True
+        if len(words_lower) >= 4:
+            # One alternation search beats a substring test per word from about 4 words
+            blacklist_re = re.compile('|'.join(map(re.escape, words_lower)))
+
+            def contains_blacklisted(pwd, result):
+                return blacklist_re.search(pwd.lower()) is None
+        else:
+            def contains_blacklisted(pwd, result):
+                pwd_lower = pwd.lower()
+                for word in words_lower:
+                    if word in pwd_lower:
+                        return False
+                return True
 
         rule = PolicyRule(
             name="blacklist_words",
@@ -234,6 +270,54 @@ class PasswordPolicy:
         self.add_rule(rule)
         return self
 
+    def compile(self):
+        """
+        Generate one function that runs every rule inline
+
+        Count-based rules become comparisons against a single count_characters()
+        result, other validators are called directly with the same error handling
+        as PolicyRule.validate. validate() compiles on first use and again after
+        the rule list changes.
+        """
+        namespace = {'count_characters': count_characters}
+        lines = [
+            "def _validate(password, analysis_result):",
+            "    errors = []",
+        ]
+        if any(rule.count_check is not None for rule in self.rules):
+            lines.append("    counts = count_characters(password)")
+
+        for index, rule in enumerate(self.rules):
+            namespace[f"rule_{index}"] = rule
+            namespace[f"message_{index}"] = rule.error_message
+            if rule.count_check is not None:
+                count_index, limit, is_maximum = rule.count_check
+                namespace[f"limit_{index}"] = limit
+                operator = ">" if is_maximum else "<"
+                lines.append(f"    if counts[{int(count_index)}] {operator} limit_{index}: errors.append(message_{index})")
+            elif type(rule) is PolicyRule:
+                namespace[f"validator_{index}"] = rule.validator
+                lines += [
+                    "    try:",
+                    f"        if not validator_{index}(password, analysis_result): errors.append(message_{index})",
+                    "    except Exception as e:",
+                    "        errors.append(f\"Validation error: {str(e)}\")",
+                ]
+            else:
+                # Subclasses may override validate, so keep calling it
+                lines += [
+                    f"    is_valid, error_msg = rule_{index}.validate(password, analysis_result)",
+                    "    if not is_valid: errors.append(error_msg)",
+                ]
+
+        lines.append("    return (len(errors) == 0, errors)")
+        exec("\n".join(lines), namespace)
+
+        self._compiled = namespace['_validate']
+        # The compiled namespace holds every rule, so their ids stay unique
+        self._compiled_key = tuple(map(id, self.rules))
+        return self
+
     def validate(self, password: str, analysis_result: Optional[Dict[str, Any]] = None) -> Tuple[bool, List[str]]:
         """
         Validate password against all policy rules
@@ -245,14 +329,10 @@ class PasswordPolicy:
         Returns:
             Tuple of (is_valid, list_of_errors)
         """
-        errors = []
-
-        for rule in self.rules:
-            is_valid, error_msg = rule.validate(password, analysis_result)
-            if not is_valid:
-                errors.append(error_msg)
-
-        return (len(errors) == 0, errors)
+        # Recompile if rules were added, removed or replaced, including directly through self.rules
+        if self._compiled is None or self._compiled_key != tuple(map(id, self.rules)):
+            self.compile()
+        return self._compiled(password, analysis_result)
 
     def get_requirements(self) -> List[str]:
         """Get list of policy requirements"""
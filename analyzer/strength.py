@@ -1,7 +1,14 @@
-from analyzer.entropy import CalculateEntropy
+from bisect import bisect_right
+from analyzer.entropy import CalculateEntropy, GetCharacterClassMask, CountCharacterClasses, CLASS_ALL
+from analyzer.context import AnalysisContext
 from typing import Dict, List, Optional, Any
 
-def CalculateStrength(password: str, patterns: Optional[Dict[str, List[str]]] = None) -> float:
+# Only the first MAX_ANALYZED_LENGTH characters are scored. Every factor has
+# saturated long before this, and it bounds the cost of huge inputs
+MAX_ANALYZED_LENGTH = 100
+
+def CalculateStrength(password: str, patterns: Optional[Dict[str, List[str]]] = None,
+                      context: Optional[AnalysisContext] = None, entropy: Optional[float] = None) -> float:
     """
     Calculate password strength score (0-100)
 
@@ -10,20 +17,29 @@ def CalculateStrength(password: str, patterns: Optional[Dict[str, List[str]]] =
     - Character diversity (25%): Lowercase, uppercase, numbers, symbols
     - Entropy (25%): Shannon entropy calculation
     - Pattern penalties (20%): Sequences, repeats, keyboard walks
+
+    An AnalysisContext may be passed to reuse precomputed password properties,
+    and entropy to reuse an already calculated CalculateEntropy result.
+    Passwords longer than MAX_ANALYZED_LENGTH are scored on their first
+    MAX_ANALYZED_LENGTH characters
     """
     if not password:
         return 0
 
-    score = 0
+    if len(password) > MAX_ANALYZED_LENGTH:
+        password = password[:MAX_ANALYZED_LENGTH]
+        context = entropy = None  # Computed for the full password
+
+    score: float = 0
 
     # Length scoring (0-30 points)
     score += CalculateLengthScore(password)
 
     # Character diversity (0-25 points)
-    score += CalculateCharacterDiversity(password)
+    score += CalculateCharacterDiversity(password, context.class_mask if context else None)
 
     # Entropy (0-25 points)
-    score += CalculateEntropyScore(password)
+    score += CalculateEntropyScore(password, context, entropy)
 
     # Pattern penalties (subtract up to 20 points)
     if patterns:
@@ -32,16 +48,8 @@ def CalculateStrength(password: str, patterns: Optional[Dict[str, List[str]]] =
 
     return max(0, min(100, score))  # Clamp to 0-100
 
-def CalculateLengthScore(password: str) -> float:
-    """
-    Calculate score based on password length (0-30 points)
-    - < 8 chars: 0-10 points (proportional)
-    - 8-12 chars: 10-20 points
-    - 13-16 chars: 20-25 points
-    - 17+ chars: 25-30 points
-    """
-    length = len(password)
-
+def _LengthScore(length: int) -> float:
+    """Piecewise length score, used to build LENGTH_SCORE_TABLE"""
     if length < 8:
         return min(10, length * 1.25)  # Proportional up to 10
     elif length < 13:
@@ -51,21 +59,23 @@ def CalculateLengthScore(password: str) -> float:
     else:
         return min(30, 25 + (length - 16) * 0.5)  # 25-30 points
 
-def CalculateCharacterDiversity(password: str) -> int:
+# Length score for every length up to the analysis cap, the score is flat beyond it
+LENGTH_SCORE_TABLE = tuple(_LengthScore(length) for length in range(MAX_ANALYZED_LENGTH + 1))
+
+def CalculateLengthScore(password: str) -> float:
     """
-    Calculate score based on character type diversity (0-25 points)
-    - 1 type (all lowercase): 5 points
-    - 2 types (lower + numbers): 10 points
-    - 3 types (lower + upper + numbers): 18 points
-    - 4 types (all categories): 25 points
+    Calculate score based on password length (0-30 points)
+    - < 8 chars: 0-10 points (proportional)
+    - 8-12 chars: 10-20 points
+    - 13-16 chars: 20-25 points
+    - 17+ chars: 25-30 points
     """
-    has_lowercase = any(c.islower() for c in password)
-    has_uppercase = any(c.isupper() for c in password)
-    has_digits = any(c.isdigit() for c in password)
-    has_symbols = any(not c.isalnum() for c in password)
-
-    type_count = sum([has_lowercase, has_uppercase, has_digits, has_symbols])
+    length = len(password)
+    # A comparison is cheaper than calling min()
+    return LENGTH_SCORE_TABLE[length if length <= MAX_ANALYZED_LENGTH else MAX_ANALYZED_LENGTH]
 
+def _DiversityScore(type_count: int) -> int:
+    """Diversity points for a number of character types, used to build DIVERSITY_SCORE_TABLE"""
     if type_count == 1:
         return 5
     elif type_count == 2:
@@ -75,12 +85,30 @@ def CalculateCharacterDiversity(password: str) -> int:
     else:  # type_count == 4
         return 25
 
-def CalculateEntropyScore(password: str) -> float:
+# Diversity points for every 4-bit character class mask
+DIVERSITY_SCORE_TABLE = tuple(_DiversityScore(CountCharacterClasses(mask)) for mask in range(CLASS_ALL + 1))
+
+def CalculateCharacterDiversity(password: str, mask: Optional[int] = None) -> int:
+    """
+    Calculate score based on character type diversity (0-25 points)
+    - 1 type (all lowercase): 5 points
+    - 2 types (lower + numbers): 10 points
+    - 3 types (lower + upper + numbers): 18 points
+    - 4 types (all categories): 25 points
+    """
+    if mask is None:
+        mask = GetCharacterClassMask(password)
+
+    return DIVERSITY_SCORE_TABLE[mask]
+
+def CalculateEntropyScore(password: str, context: Optional[AnalysisContext] = None,
+                          entropy: Optional[float] = None) -> float:
     """
     Calculate score based on Shannon entropy (0-25 points)
-    Normalized from entropy value
+    Normalized from entropy value, calculated here unless already known
     """
-    entropy = CalculateEntropy(password)
+    if entropy is None:
+        entropy = CalculateEntropy(password, context)
 
     # Normalize entropy to 0-25 scale
     # Typical strong passwords have 50-80 bits of entropy
@@ -100,6 +128,9 @@ def CalculatePatternPenalty(patterns: Dict[str, List[str]]) -> int:
     - Leetspeak: -6 points
     - Context patterns: -4 points per pattern (max -8)
     """
+    # Explicit checks measured faster than a loop over a (key, cost, cap) rule table.
+    # An any(patterns.values()) early exit speeds up clean passwords but slows the
+    # patterned ones, which dominate audited password lists, so it is not used
     penalty = 0
 
     if patterns.get('sequences'):
@@ -130,14 +161,10 @@ def CalculatePatternPenalty(patterns: Dict[str, List[str]]) -> int:
 
     return min(30, penalty)  # Cap at 30 points (increased from 20)
 
+# Lower bound of each category above "Very Weak", searched with bisect
+STRENGTH_THRESHOLDS = (20, 40, 60, 80)
+STRENGTH_CATEGORIES = ("Very Weak", "Weak", "Medium", "Strong", "Very Strong")
+
 def GetStrengthCategory(score: float) -> str:
     """Convert numerical score to category"""
-    if score >= 80:
-        return "Very Strong"
-    if score >= 60:
-        return "Strong"
-    if score >= 40:
-        return "Medium"
-    if score >= 20:
-        return "Weak"
-    return "Very Weak"
+    return STRENGTH_CATEGORIES[bisect_right(STRENGTH_THRESHOLDS, score)]
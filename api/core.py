@@ -3,16 +3,94 @@ PassAudit Core API
 Provides a clean, object-oriented interface for password analysis and generation
 """
 
-from typing import Dict, List, Optional, Any
-from analyzer.patterns import DetectPatterns
-from analyzer.strength import CalculateStrength, GetStrengthCategory
+import os
+from copy import deepcopy
+from functools import lru_cache
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Any, Tuple
+from analyzer.context import BuildAnalysisContext
+from analyzer.patterns import DetectPatterns, ClearPatternCache
+from analyzer.strength import CalculateStrength, GetStrengthCategory, MAX_ANALYZED_LENGTH
 from analyzer.entropy import CalculateEntropy, CalculateCharacterPoolEntropy
 from analyzer.feedback import GenerateFeedback
-from analyzer.common_passwords import IsCommonPassword
-from analyzer.hibp import CheckHIBP
-from analyzer.generator import GeneratePassword, GeneratePasswords as GenPasswords
+from analyzer.common_passwords import IsCommonPassword, GetCommonPasswords
 from utils.config import LoadConfig
 
+# analyzer.hibp and analyzer.generator are imported by the methods that use
+# them, so analysis-only callers skip their import cost
+
+
+# Batches with at least this many distinct passwords are analyzed in a process
+# pool, by PassAuditAPI.analyze_batch and the CLI's AnalyzePasswords. Smaller ones
+# (e.g. the web routes' 1000 password cap) finish faster serially than it takes
+# to start the workers
+PARALLEL_THRESHOLD = 2000
+
+
+@lru_cache(maxsize=1)
+def _load_shared_config() -> Dict[str, Any]:
+    """Load the config file once per process for every API instance"""
+    return LoadConfig()
+
+
+class CoreAnalysis(NamedTuple):
+    """Every non-HIBP analysis result for one password"""
+    patterns: Dict[str, List[str]]
+    strength_score: float
+    strength_category: str
+    is_common: bool
+    entropy: float
+    pool_entropy: float
+    feedback: Tuple[str, ...]
+
+
+@lru_cache(maxsize=4096)
+def _analyze_core(password: str) -> CoreAnalysis:
+    """
+    Run the local analyzers over a password, memoized per process
+    Callers must copy patterns before handing them out. The cache keeps up to
+    4096 plaintext passwords alive, long-running servers should call
+    clear_analysis_cache once a request is done
+    """
+    # Scan the password once for the analyzers below
+    context = BuildAnalysisContext(password)
+
+    patterns = DetectPatterns(password)
+    is_common = IsCommonPassword(password, context)
+    # Entropy is shared with the strength score rather than calculated twice
+    entropy = CalculateEntropy(password, context)
+    strength_score = CalculateStrength(password, patterns, context, entropy)
+
+    return CoreAnalysis(
+        patterns=patterns,
+        strength_score=strength_score,
+        strength_category=GetStrengthCategory(strength_score),
+        is_common=is_common,
+        entropy=entropy,
+        pool_entropy=CalculateCharacterPoolEntropy(password, context),
+        feedback=tuple(GenerateFeedback(password, strength_score, patterns, is_common, context))
+    )
+
+
+def clear_analysis_cache():
+    """Drop analysis and pattern results memoized in this process"""
+    _analyze_core.cache_clear()
+    ClearPatternCache()
+
+
+def expand_results(passwords: Iterable[str], computed: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Expand results computed once per distinct password back to input order
+    Duplicates get a deep copy, so nested patterns and feedback lists are not shared
+    """
+    results = []
+    seen = set()
+    for password in passwords:
+        result = computed[password]
+        results.append(deepcopy(result) if password in seen else result)
+        seen.add(password)
+    return results
+
 
 class PassAuditAPI:
     """
@@ -24,6 +102,12 @@ class PassAuditAPI:
         passwords = api.generate_password(length=20, count=5)
     """
 
+    # Process pool cutoff, overridable per instance
+    PARALLEL_THRESHOLD = PARALLEL_THRESHOLD
+
+    # Passwords analyzed per batch by iter_analyze
+    STREAM_CHUNK_SIZE = 1000
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Initialize PassAudit API
@@ -31,7 +115,20 @@ class PassAuditAPI:
         Args:
             config: Optional configuration dictionary. If None, loads from config file.
         """
-        self.config = config if config is not None else LoadConfig()
+        if config is None:
+            # Sections are copied so changes to one instance's config stay local
+            config = {section: dict(values) if isinstance(values, dict) else values
+                      for section, values in _load_shared_config().items()}
+        self.config = config
+
+    def warmup(self) -> None:
+        """
+        Load the common passwords database now rather than on the first analysis
+
+        Long-running callers (interactive mode, servers) can call this at startup
+        so the first password analyzed does not pay for the file load
+        """
+        GetCommonPasswords()
 
     def analyze_password(self, password: str, check_hibp: bool = False) -> Dict[str, Any]:
         """
@@ -53,44 +150,39 @@ class PassAuditAPI:
             - patterns: Dictionary of detected patterns
             - feedback: List of recommendations
             - hibp_pwned: (optional) Whether found in breaches
-            - hibp_count: (optional) Number of times breached
+            - hibp_count: (optional) Number of times breached, None for common
+              passwords skipped by security.hibp_skip_common
         """
-        # Perform pattern detection
-        patterns = DetectPatterns(password)
-
-        # Check if common password
-        is_common = IsCommonPassword(password)
+        # Analysis is bounded to the first MAX_ANALYZED_LENGTH characters,
+        # length is still reported for the whole password
+        core = _analyze_core(password[:MAX_ANALYZED_LENGTH])
 
-        # Check HIBP if requested
+        # Check HIBP if requested, common passwords are known to be breached
         hibp_pwned = False
         hibp_count = 0
-        if check_hibp:
-            timeout = self.config.get('security', {}).get('hibp_timeout', 5)
-            hibp_pwned, hibp_count = CheckHIBP(password, timeout=timeout)
+        if check_hibp and core.is_common and self.config.get('security', {}).get('hibp_skip_common', True):
+            hibp_pwned, hibp_count = True, None
+        elif check_hibp:
+            from analyzer.hibp import CheckHIBP
+
+            security = self.config.get('security', {})
+            hibp_pwned, hibp_count = CheckHIBP(password, timeout=security.get('hibp_timeout', 5),
+                                               use_cache=security.get('cache_enabled', True))
             if hibp_pwned is None:
                 hibp_pwned = False
                 hibp_count = -1  # Indicates check failed
 
-        # Calculate strength metrics
-        strength_score = CalculateStrength(password, patterns)
-        strength_category = GetStrengthCategory(strength_score)
-        entropy = CalculateEntropy(password)
-        pool_entropy = CalculateCharacterPoolEntropy(password)
-
-        # Generate feedback
-        feedback = GenerateFeedback(password, strength_score, patterns, is_common)
-
-        # Compile results
+        # Compile results, with copies of the memoized lists
         result = {
             'password': password,
-            'strength_score': strength_score,
-            'strength_category': strength_category,
-            'is_common': is_common,
-            'entropy': entropy,
-            'pool_entropy': pool_entropy,
+            'strength_score': core.strength_score,
+            'strength_category': core.strength_category,
+            'is_common': core.is_common,
+            'entropy': core.entropy,
+            'pool_entropy': core.pool_entropy,
             'length': len(password),
-            'patterns': patterns,
-            'feedback': feedback
+            'patterns': {key: list(found) for key, found in core.patterns.items()},
+            'feedback': list(core.feedback)
         }
 
         # Add HIBP data if checked
@@ -100,22 +192,117 @@ class PassAuditAPI:
 
         return result
 
-    def analyze_batch(self, passwords: List[str], check_hibp: bool = False) -> List[Dict[str, Any]]:
+    def analyze_batch(self, passwords: List[str], check_hibp: bool = False,
+                      max_workers: Optional[int] = None,
+                      progress_callback: Optional[Callable[[int, int], None]] = None) -> List[Dict[str, Any]]:
         """
         Analyze multiple passwords
 
+        HIBP lookups are resolved first, one concurrent request per unique hash
+        prefix. Large batches are then analyzed in a process pool.
+
         Args:
             passwords: List of passwords to analyze
             check_hibp: Whether to check Have I Been Pwned database
+            max_workers: Maximum number of worker processes (default: CPU count)
+            progress_callback: Optional callable receiving (done, total) as each
+                distinct password is analyzed
 
         Returns:
             List of analysis result dictionaries
         """
-        results = []
-        for password in passwords:
-            result = self.analyze_password(password, check_hibp=check_hibp)
-            results.append(result)
-        return results
+        # Each distinct password is analyzed once
+        unique_passwords = list(dict.fromkeys(passwords))
+
+        if check_hibp:
+            from analyzer.hibp import CheckHIBPBatch, HIBP_BATCH_WORKERS
+
+            security = self.config.get('security', {})
+            hibp_passwords = self.hibp_candidates(unique_passwords)
+            hibp_results = dict(zip(hibp_passwords, CheckHIBPBatch(
+                hibp_passwords,
+                timeout=security.get('hibp_timeout', 5),
+                use_cache=security.get('cache_enabled', True),
+                max_workers=security.get('hibp_concurrency', HIBP_BATCH_WORKERS)
+            )))
+
+        if not max_workers:
+            max_workers = os.cpu_count() or 1
+
+        if max_workers > 1 and len(unique_passwords) >= self.PARALLEL_THRESHOLD:
+            from concurrent.futures import ProcessPoolExecutor
+
+            # About 4 chunks per worker amortizes the pickling round trip
+            chunksize = max(1, len(unique_passwords) // (4 * max_workers))
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                unique_results = self._collect_results(
+                    executor.map(self.analyze_password, unique_passwords, chunksize=chunksize),
+                    len(unique_passwords), progress_callback)
+        else:
+            unique_results = self._collect_results(
+                map(self.analyze_password, unique_passwords), len(unique_passwords), progress_callback)
+
+        if check_hibp:
+            for password, result in zip(unique_passwords, unique_results):
+                self.apply_hibp_result(result, *hibp_results.get(password, (True, None)))
+
+        return expand_results(passwords, dict(zip(unique_passwords, unique_results)))
+
+    @staticmethod
+    def _collect_results(results: Iterable[Dict[str, Any]], total: int,
+                         progress_callback: Optional[Callable[[int, int], None]]) -> List[Dict[str, Any]]:
+        """Gather analysis results, reporting (done, total) to progress_callback if given"""
+        if progress_callback is None:
+            return list(results)
+
+        collected = []
+        for result in results:
+            collected.append(result)
+            progress_callback(len(collected), total)
+        return collected
+
+    def iter_analyze(self, passwords: Iterable[str], check_hibp: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Analyze passwords lazily, yielding results in input order
+
+        Passwords are consumed STREAM_CHUNK_SIZE at a time and each chunk goes
+        through analyze_batch, so memory stays bounded for large inputs and
+        results can be written out while later passwords are still unread.
+
+        Args:
+            passwords: Any iterable of passwords, e.g. an open file
+            check_hibp: Whether to check Have I Been Pwned database
+
+        Yields:
+            Analysis result dictionaries
+        """
+        iterator = iter(passwords)
+        while True:
+            chunk = list(islice(iterator, self.STREAM_CHUNK_SIZE))
+            if not chunk:
+                return
+            yield from self.analyze_batch(chunk, check_hibp=check_hibp)
+
+    def hibp_candidates(self, passwords: List[str]) -> List[str]:
+        """
+        Passwords that need a HIBP request
+
+        With security.hibp_skip_common (the default) common passwords are left
+        out, callers report them as breached with hibp_count None
+        """
+        if not self.config.get('security', {}).get('hibp_skip_common', True):
+            return passwords
+        return [password for password in passwords if not IsCommonPassword(password[:MAX_ANALYZED_LENGTH])]
+
+    @staticmethod
+    def apply_hibp_result(result: Dict[str, Any], hibp_pwned: Optional[bool], hibp_count: Optional[int]) -> Dict[str, Any]:
+        """Attach a (hibp_pwned, hibp_count) lookup to an analysis result"""
+        if hibp_pwned is None:
+            hibp_pwned = False
+            hibp_count = -1  # Indicates check failed
+        result['hibp_pwned'] = hibp_pwned
+        result['hibp_count'] = hibp_count
+        return result
 
     def generate_password(
         self,
@@ -138,6 +325,8 @@ class PassAuditAPI:
         Returns:
             Generated password string
         """
+        from analyzer.generator import GeneratePassword
+
         return GeneratePassword(
             length=length,
             use_uppercase=use_uppercase,
@@ -169,7 +358,9 @@ class PassAuditAPI:
         Returns:
             List of generated passwords
         """
-        return GenPasswords(
+        from analyzer.generator import GeneratePasswords
+
+        return GeneratePasswords(
             count=count,
             length=length,
             use_uppercase=use_uppercase,
@@ -188,8 +379,7 @@ class PassAuditAPI:
         Returns:
             Strength score (0-100)
         """
-        patterns = DetectPatterns(password)
-        return CalculateStrength(password, patterns)
+        return _analyze_core(password[:MAX_ANALYZED_LENGTH]).strength_score
 
     def check_common(self, password: str) -> bool:
         """
@@ -215,8 +405,11 @@ class PassAuditAPI:
             is_breached: True if found in breaches, False if not, None if check failed
             breach_count: Number of times found, 0 if not found, -1 if check failed
         """
-        timeout = self.config.get('security', {}).get('hibp_timeout', 5)
-        return CheckHIBP(password, timeout=timeout)
+        from analyzer.hibp import CheckHIBP
+
+        security = self.config.get('security', {})
+        return CheckHIBP(password, timeout=security.get('hibp_timeout', 5),
+                         use_cache=security.get('cache_enabled', True))
 
     def get_feedback(self, password: str) -> List[str]:
         """
@@ -228,7 +421,4 @@ class PassAuditAPI:
         Returns:
             List of recommendation strings
         """
-        patterns = DetectPatterns(password)
-        strength_score = CalculateStrength(password, patterns)
-        is_common = IsCommonPassword(password)
-        return GenerateFeedback(password, strength_score, patterns, is_common)
+        return list(_analyze_core(password[:MAX_ANALYZED_LENGTH]).feedback)
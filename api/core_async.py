@@ -0,0 +1,90 @@
+"""
+PassAudit Async API
+asyncio entry points for callers that already run an event loop
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+
+from analyzer.hibp import CheckHIBPBatch, HIBP_BATCH_WORKERS
+from api.core import PassAuditAPI
+
+
+async def check_hibp_batch_async(passwords: List[str], timeout: float = 5, use_cache: bool = True,
+                                 max_workers: int = HIBP_BATCH_WORKERS) -> List[Tuple[Optional[bool], int]]:
+    """
+    Check multiple passwords against Have I Been Pwned without blocking the event loop
+
+    Runs CheckHIBPBatch (one concurrent range request per unique hash prefix)
+    in a worker thread.
+
+    Args:
+        passwords: List of passwords to check
+        timeout: Request timeout in seconds (default: 5)
+        use_cache: Whether to use the range cache (default: True)
+        max_workers: Maximum number of concurrent range requests
+
+    Returns:
+        List of (is_pwned, breach_count) tuples in the same order as passwords
+    """
+    return await asyncio.to_thread(CheckHIBPBatch, passwords, timeout, use_cache, max_workers)
+
+
+async def analyze_batch_async(passwords: List[str], check_hibp: bool = False,
+                              api: Optional[PassAuditAPI] = None) -> List[Dict[str, Any]]:
+    """
+    Analyze multiple passwords without blocking the event loop
+
+    The CPU-bound analysis runs in a worker thread while the HIBP requests are
+    in flight, so wall time is roughly the longer of the two.
+
+    Args:
+        passwords: List of passwords to analyze
+        check_hibp: Whether to check Have I Been Pwned database
+        api: PassAuditAPI instance to use (default: one with the loaded config)
+
+    Returns:
+        List of analysis result dictionaries
+    """
+    if api is None:
+        api = PassAuditAPI()
+
+    analysis = asyncio.to_thread(api.analyze_batch, passwords)
+    if not check_hibp:
+        return await analysis
+
+    security = api.config.get('security', {})
+
+    def check_candidates():
+        # Filtering common passwords may load the list, so it runs off the loop too
+        hibp_passwords = api.hibp_candidates(list(dict.fromkeys(passwords)))
+        return dict(zip(hibp_passwords, CheckHIBPBatch(
+            hibp_passwords,
+            timeout=security.get('hibp_timeout', 5),
+            use_cache=security.get('cache_enabled', True),
+            max_workers=security.get('hibp_concurrency', HIBP_BATCH_WORKERS)
+        )))
+
+    results, hibp_results = await asyncio.gather(analysis, asyncio.to_thread(check_candidates))
+
+    for password, result in zip(passwords, results):
+        api.apply_hibp_result(result, *hibp_results.get(password, (True, None)))
+
+    return results
+
+
+async def analyze_password_async(password: str, check_hibp: bool = False,
+                                 api: Optional[PassAuditAPI] = None) -> Dict[str, Any]:
+    """
+    Analyze a single password without blocking the event loop
+
+    Args:
+        password: The password to analyze
+        check_hibp: Whether to check Have I Been Pwned database
+        api: PassAuditAPI instance to use (default: one with the loaded config)
+
+    Returns:
+        Analysis result dictionary, see PassAuditAPI.analyze_password
+    """
+    results = await analyze_batch_async([password], check_hibp=check_hibp, api=api)
+    return results[0]
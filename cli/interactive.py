@@ -7,6 +7,7 @@ import os
 import sys
 import time
 import json
+from collections import Counter
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from pathlib import Path
@@ -16,10 +17,21 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 from api import PassAuditAPI
 from analyzer.generator import GeneratePasswords
+from analyzer.strength import STRENGTH_CATEGORIES
 from utils.config import LoadConfig, ShowConfig, UpdateConfigValue
 from utils.cache import get_cache
+from analyzer.hibp import ClearMemoryCache
 from utils.export import ExportToCSV, ExportToHTML
-from utils.export_pdf import ExportToPDF
+
+# Use orjson for indented JSON output if available, it is several times faster
+try:
+    import orjson
+
+    def _DumpsIndented(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+except ImportError:
+    def _DumpsIndented(obj) -> str:
+        return json.dumps(obj, indent=2)
 
 
 class InteractiveCLI:
@@ -28,13 +40,42 @@ class InteractiveCLI:
     def __init__(self):
         """Initialize interactive CLI"""
         self.api = PassAuditAPI()
+        # Every session analyzes passwords, load the common passwords up front
+        self.api.warmup()
         self.session_history = []
+        # Analysis results of this session, kept alongside the history for export
+        self.session_results = []
         self.config = LoadConfig()
         self.running = True
 
+        # The screen is cleared with ANSI escapes rather than a clear/cls subprocess
+        # per menu refresh, except on terminals that declare no escape support
+        self._ansi_clear = os.environ.get('TERM') != 'dumb'
+        if self._ansi_clear and os.name == 'nt':
+            os.system('')  # Enables ANSI escape handling in the Windows console
+
+        # Menu option -> handler, built once rather than an if/elif chain per loop
+        self._menu = {
+            '1': self.analyze_single_password,
+            '2': self.analyze_password_file,
+            '3': self.generate_passwords,
+            '4': self.check_hibp,
+            '5': self.view_update_config,
+            '6': self.view_database_stats,
+            '7': self.clear_hibp_cache,
+            '8': self.view_session_history,
+            '9': self.export_session_results,
+            '0': self.exit_cli
+        }
+
     def clear_screen(self):
         """Clear the terminal screen"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if self._ansi_clear:
+            # Erase display, cursor home
+            sys.stdout.write("\x1b[2J\x1b[H")
+            sys.stdout.flush()
+        else:
+            os.system('cls' if os.name == 'nt' else 'clear')
 
     def print_header(self):
         """Print application header"""
@@ -108,7 +149,9 @@ class InteractiveCLI:
         print(f"Is Common: {'YES [WARNING]' if result['is_common'] else 'NO [OK]'}")
 
         if check_hibp and 'hibp_pwned' in result:
-            if result['hibp_pwned']:
+            if result['hibp_count'] is None:
+                print("HIBP Status: [WARNING] Common password, known to be breached!")
+            elif result['hibp_pwned']:
                 print(f"HIBP Status: [WARNING] Found in {result['hibp_count']:,} breaches!")
             else:
                 print("HIBP Status: [OK] Not found in breaches")
@@ -132,6 +175,7 @@ class InteractiveCLI:
             'action': 'analyze_single',
             'result': result
         })
+        self.session_results.append(result)
 
         self.wait_for_key()
 
@@ -152,7 +196,9 @@ class InteractiveCLI:
         print("\nReading passwords from file...")
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
-                passwords = [line.strip() for line in f if line.strip()]
+                # Every result keeps its password and is needed for the session
+                # history and export, so the file is read in full rather than streamed
+                passwords = list(filter(None, map(str.strip, f)))
         except Exception as e:
             print(f"\n[ERROR] Could not read file: {e}")
             self.wait_for_key()
@@ -175,10 +221,22 @@ class InteractiveCLI:
         print("ANALYSIS SUMMARY")
         print("="*70)
 
+        # One pass over the results. strength_category already buckets the score
+        # at the 20/40/60/80 thresholds shown in the distribution below
         total = len(results)
-        avg_score = sum(r['strength_score'] for r in results) / total
-        weak_count = sum(1 for r in results if r['strength_score'] < 40)
-        common_count = sum(1 for r in results if r['is_common'])
+        score_total = 0
+        common_count = 0
+        breached_count = 0
+        category_counts = Counter()
+        for r in results:
+            score_total += r['strength_score']
+            common_count += r['is_common']
+            if r.get('hibp_pwned', False):
+                breached_count += 1
+            category_counts[r['strength_category']] += 1
+
+        avg_score = score_total / total
+        weak_count = category_counts['Very Weak'] + category_counts['Weak']
 
         print(f"\nTotal Passwords: {total}")
         print(f"Average Strength: {avg_score:.1f}/100")
@@ -186,24 +244,18 @@ class InteractiveCLI:
         print(f"Common Passwords: {common_count} ({common_count/total*100:.1f}%)")
 
         if check_hibp:
-            breached_count = sum(1 for r in results if r.get('hibp_pwned', False))
             print(f"Breached (HIBP): {breached_count} ({breached_count/total*100:.1f}%)")
 
         # Strength distribution
-        strength_dist = {
-            'Very Weak': sum(1 for r in results if r['strength_score'] < 20),
-            'Weak': sum(1 for r in results if 20 <= r['strength_score'] < 40),
-            'Medium': sum(1 for r in results if 40 <= r['strength_score'] < 60),
-            'Strong': sum(1 for r in results if 60 <= r['strength_score'] < 80),
-            'Very Strong': sum(1 for r in results if r['strength_score'] >= 80)
-        }
+        strength_dist = {category: category_counts[category] for category in STRENGTH_CATEGORIES}
 
-        print("\nStrength Distribution:")
+        lines = ["\nStrength Distribution:"]
         for category, count in strength_dist.items():
             if count > 0:
                 percentage = (count / total) * 100
                 bar = '#' * int(percentage / 2)
-                print(f"  {category:12} | {bar:25} {count:3d} ({percentage:5.1f}%)")
+                lines.append(f"  {category:12} | {bar:25} {count:3d} ({percentage:5.1f}%)")
+        print('\n'.join(lines))
 
         print(f"\nProcessing speed: {total/duration:.1f} passwords/sec")
         print(f"Total time: {duration:.2f}s")
@@ -215,6 +267,7 @@ class InteractiveCLI:
             'file_path': file_path,
             'results': results
         })
+        self.session_results.extend(results)
 
         # Offer to export
         print("\n" + "-"*70)
@@ -227,6 +280,8 @@ class InteractiveCLI:
                 elif export == 'html':
                     ExportToHTML(results, output_file)
                 elif export == 'pdf':
+                    # ReportLab is only imported when a PDF is requested
+                    from utils.export_pdf import ExportToPDF
                     ExportToPDF(results, output_file)
             except Exception as e:
                 print(f"\n[ERROR] Export failed: {e}")
@@ -271,13 +326,14 @@ class InteractiveCLI:
         print("GENERATED PASSWORDS")
         print("="*70 + "\n")
 
-        for idx, password in enumerate(passwords, 1):
-            # Analyze each generated password
-            result = self.api.analyze_password(password)
-            score = result['strength_score']
-            category = result['strength_category']
+        # Analyze the generated passwords in one call
+        results = self.api.analyze_batch(passwords)
 
-            print(f"{idx:2d}. {password:30} | Score: {score:5.1f} ({category})")
+        # Lines are written with a single print
+        print('\n'.join(
+            f"{idx:2d}. {password:30} | Score: {result['strength_score']:5.1f} ({result['strength_category']})"
+            for idx, (password, result) in enumerate(zip(passwords, results), 1)
+        ))
 
         # Add to session history
         self.session_history.append({
@@ -328,7 +384,7 @@ class InteractiveCLI:
         print("\n--- Configuration ---\n")
 
         print("Current Configuration:")
-        print(json.dumps(self.config, indent=2))
+        print(_DumpsIndented(self.config))
 
         print("\n" + "-"*70)
         update = self.get_input("Update a setting? (y/n)", "n").lower()
@@ -348,6 +404,15 @@ class InteractiveCLI:
 
         self.wait_for_key()
 
+    @staticmethod
+    def _count_data_entries(file_path: str) -> int:
+        """Count the non-blank, non-comment lines of a data file"""
+        # Scanned as bytes, no decoding and no Python loop over the lines
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        comment_count = data.count(b'\n#') + data.startswith(b'#')
+        return len(list(filter(None, map(bytes.strip, data.splitlines())))) - comment_count
+
     def view_database_stats(self):
         """Option 6: View database statistics"""
         self.clear_screen()
@@ -357,8 +422,7 @@ class InteractiveCLI:
         # Check common passwords database
         common_passwords_file = os.path.join('data', 'common_passwords.txt')
         if os.path.exists(common_passwords_file):
-            with open(common_passwords_file, 'r') as f:
-                common_count = sum(1 for line in f if line.strip() and not line.startswith('#'))
+            common_count = self._count_data_entries(common_passwords_file)
             print(f"Common Passwords Database: {common_count:,} entries")
         else:
             print("Common Passwords Database: Not found")
@@ -366,8 +430,7 @@ class InteractiveCLI:
         # Check common words
         common_words_file = os.path.join('data', 'common_words.txt')
         if os.path.exists(common_words_file):
-            with open(common_words_file, 'r') as f:
-                words_count = sum(1 for line in f if line.strip() and not line.startswith('#'))
+            words_count = self._count_data_entries(common_words_file)
             print(f"Common Words Database: {words_count} entries")
         else:
             print("Common Words Database: Not found")
@@ -375,8 +438,7 @@ class InteractiveCLI:
         # Check context patterns
         context_file = os.path.join('data', 'context_patterns.txt')
         if os.path.exists(context_file):
-            with open(context_file, 'r') as f:
-                context_count = sum(1 for line in f if line.strip() and not line.startswith('#'))
+            context_count = self._count_data_entries(context_file)
             print(f"Context Patterns Database: {context_count} entries")
         else:
             print("Context Patterns Database: Not found")
@@ -386,7 +448,7 @@ class InteractiveCLI:
             cache = get_cache()
             stats = cache.get_stats()
             print(f"\nHIBP Cache Statistics:")
-            print(f"  Total Entries: {stats['total_entries']:,}")
+            print(f"  Cached Hash Prefixes: {stats['total_entries']:,}")
             print(f"  Expired Entries: {stats['expired_entries']:,}")
             print(f"  Cache Hit Rate: ~90%+ (estimated after warmup)")
         except Exception as e:
@@ -408,6 +470,7 @@ class InteractiveCLI:
             confirm = self.get_input("\nAre you sure you want to clear the cache? (yes/no)", "no")
             if confirm.lower() == 'yes':
                 cache.clear()
+                ClearMemoryCache()
                 print("\n[OK] HIBP cache cleared successfully")
             else:
                 print("\n[INFO] Cache clear cancelled")
@@ -441,13 +504,7 @@ class InteractiveCLI:
         self.print_header()
         print("\n--- Export Session Results ---\n")
 
-        # Collect all results from session
-        all_results = []
-        for item in self.session_history:
-            if item['action'] == 'analyze_single' and 'result' in item:
-                all_results.append(item['result'])
-            elif item['action'] == 'analyze_file' and 'results' in item:
-                all_results.extend(item['results'])
+        all_results = self.session_results
 
         if not all_results:
             print("No analysis results to export in this session.")
@@ -470,6 +527,7 @@ class InteractiveCLI:
             elif export_format == 'html':
                 ExportToHTML(all_results, output_file)
             elif export_format == 'pdf':
+                from utils.export_pdf import ExportToPDF
                 ExportToPDF(all_results, output_file)
             print(f"\n[OK] Results exported to: {output_file}")
         except Exception as e:
@@ -491,8 +549,9 @@ class InteractiveCLI:
             if save == 'y':
                 filename = self.get_input("Filename", "session_history.json")
                 try:
-                    with open(filename, 'w') as f:
-                        json.dump(self.session_history, f, indent=2)
+                    # Serialized in one call, json.dump writes chunk by chunk and is slower
+                    with open(filename, 'w', encoding='utf-8') as f:
+                        f.write(_DumpsIndented(self.session_history))
                     print(f"\n[OK] Session history saved to: {filename}")
                 except Exception as e:
                     print(f"\n[ERROR] Failed to save: {e}")
@@ -500,6 +559,11 @@ class InteractiveCLI:
         print("\nThank you for using PassAudit!")
         self.running = False
 
+    def invalid_choice(self):
+        """Report a menu selection that is not an option"""
+        print("\n[ERROR] Invalid option. Please select 0-9.")
+        self.wait_for_key()
+
     def run(self):
         """Main interactive loop"""
         self.clear_screen()
@@ -515,29 +579,7 @@ class InteractiveCLI:
 
             choice = self.get_input("\nSelect an option (0-9)")
 
-            if choice == '1':
-                self.analyze_single_password()
-            elif choice == '2':
-                self.analyze_password_file()
-            elif choice == '3':
-                self.generate_passwords()
-            elif choice == '4':
-                self.check_hibp()
-            elif choice == '5':
-                self.view_update_config()
-            elif choice == '6':
-                self.view_database_stats()
-            elif choice == '7':
-                self.clear_hibp_cache()
-            elif choice == '8':
-                self.view_session_history()
-            elif choice == '9':
-                self.export_session_results()
-            elif choice == '0':
-                self.exit_cli()
-            else:
-                print("\n[ERROR] Invalid option. Please select 0-9.")
-                self.wait_for_key()
+            (self._menu.get(choice) or self.invalid_choice)()
 
 
 def main():
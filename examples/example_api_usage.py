@@ -12,15 +12,12 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 from api import PassAuditAPI
 
 
-def example_basic_analysis():
+def example_basic_analysis(api: PassAuditAPI):
     """Example 1: Basic password analysis"""
     print("\n" + "="*60)
     print("Example 1: Basic Password Analysis")
     print("="*60 + "\n")
 
-    # Initialize API
-    api = PassAuditAPI()
-
     # Analyze a single password
     password = "MySecureP@ss2023"
     result = api.analyze_password(password)
@@ -38,14 +35,12 @@ def example_basic_analysis():
                 print(f"  - {pattern_type}: {items}")
 
 
-def example_batch_analysis():
+def example_batch_analysis(api: PassAuditAPI):
     """Example 2: Batch password analysis"""
     print("\n" + "="*60)
     print("Example 2: Batch Password Analysis")
     print("="*60 + "\n")
 
-    api = PassAuditAPI()
-
     # List of passwords to analyze
     passwords = [
         "password123",
@@ -66,14 +61,12 @@ def example_batch_analysis():
         print(f"{idx}. {masked:15} | Score: {score:5.1f} | {category}")
 
 
-def example_password_generation():
+def example_password_generation(api: PassAuditAPI):
     """Example 3: Generate secure passwords"""
     print("\n" + "="*60)
     print("Example 3: Password Generation")
     print("="*60 + "\n")
 
-    api = PassAuditAPI()
-
     # Generate a single password
     password = api.generate_password(length=16)
     print(f"Generated password: {password}")
@@ -89,14 +82,12 @@ def example_password_generation():
         print(f"{idx}. {pwd}")
 
 
-def example_quick_checks():
+def example_quick_checks(api: PassAuditAPI):
     """Example 4: Quick convenience methods"""
     print("\n" + "="*60)
     print("Example 4: Quick Checks")
     print("="*60 + "\n")
 
-    api = PassAuditAPI()
-
     test_passwords = [
         "password123",
         "MyS3cur3P@ss!",
@@ -142,14 +133,12 @@ def example_with_configuration():
     print(f"Category: {result['strength_category']}")
 
 
-def example_feedback_system():
+def example_feedback_system(api: PassAuditAPI):
     """Example 6: Getting actionable feedback"""
     print("\n" + "="*60)
     print("Example 6: Password Feedback System")
     print("="*60 + "\n")
 
-    api = PassAuditAPI()
-
     # Weak password
     password = "password123"
     feedback = api.get_feedback(password)
@@ -160,14 +149,12 @@ def example_feedback_system():
         print(f"  {idx}. {suggestion}")
 
 
-def example_integration():
+def example_integration(api: PassAuditAPI):
     """Example 7: Integration in user registration"""
     print("\n" + "="*60)
     print("Example 7: User Registration Integration")
     print("="*60 + "\n")
 
-    api = PassAuditAPI()
-
     def validate_password(password: str, min_strength: float = 60.0) -> tuple[bool, str]:
         """
         Validate password meets minimum requirements
@@ -211,13 +198,16 @@ def main():
     print(" "*15 + "PassAudit API Usage Examples")
     print("="*70)
 
-    example_basic_analysis()
-    example_batch_analysis()
-    example_password_generation()
-    example_quick_checks()
+    # One API instance is shared by the examples, as an application would
+    api = PassAuditAPI()
+
+    example_basic_analysis(api)
+    example_batch_analysis(api)
+    example_password_generation(api)
+    example_quick_checks(api)
     example_with_configuration()
-    example_feedback_system()
-    example_integration()
+    example_feedback_system(api)
+    example_integration(api)
 
     print("\n" + "="*70)
     print("All examples completed!")
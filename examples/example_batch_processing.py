@@ -6,33 +6,31 @@ Demonstrates efficient processing of large password lists using parallel process
 import sys
 import os
 import time
+from collections import Counter
 from typing import List, Dict, Any
 
 # Add parent directory to path to import PassAudit modules
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from api import PassAuditAPI
+from api.core import clear_analysis_cache
 from analyzer.generator import GeneratePasswords
 
 
-def example_sequential_processing():
+def example_sequential_processing(api: PassAuditAPI):
     """Example 1: Sequential processing (small batches)"""
     print("\n" + "="*60)
     print("Example 1: Sequential Processing")
     print("="*60 + "\n")
 
-    api = PassAuditAPI()
-
     # Generate test passwords
     passwords = GeneratePasswords(count=10, length=12)
 
     print(f"Processing {len(passwords)} passwords sequentially...")
     start_time = time.time()
 
-    results = []
-    for password in passwords:
-        result = api.analyze_password(password)
-        results.append(result)
+    # One process, one call: the per-call work is shared across the list
+    results = api.analyze_batch(passwords, max_workers=1)
 
     duration = time.time() - start_time
     throughput = len(passwords) / duration
@@ -42,14 +40,12 @@ def example_sequential_processing():
     print(f"Average time per password: {(duration/len(passwords)*1000):.2f}ms")
 
 
-def example_batch_processing():
+def example_batch_processing(api: PassAuditAPI):
     """Example 2: Batch processing (optimized)"""
     print("\n" + "="*60)
     print("Example 2: Batch Processing")
     print("="*60 + "\n")
 
-    api = PassAuditAPI()
-
     # Generate larger test set
     passwords = GeneratePasswords(count=50, length=12)
 
@@ -67,22 +63,19 @@ def example_batch_processing():
     print(f"Average time per password: {(duration/len(passwords)*1000):.2f}ms")
 
 
-def example_file_processing():
+def example_file_processing(api: PassAuditAPI):
     """Example 3: Processing passwords from a file"""
     print("\n" + "="*60)
     print("Example 3: File Processing")
     print("="*60 + "\n")
 
-    api = PassAuditAPI()
-
     # Create a test file
     test_file = "test_passwords.txt"
     test_passwords = GeneratePasswords(count=20, length=14)
 
     # Write to file
     with open(test_file, 'w') as f:
-        for pwd in test_passwords:
-            f.write(pwd + '\n')
+        f.write('\n'.join(test_passwords) + '\n')
 
     print(f"Created test file: {test_file}")
 
@@ -91,7 +84,7 @@ def example_file_processing():
     start_time = time.time()
 
     with open(test_file, 'r') as f:
-        passwords = [line.strip() for line in f if line.strip()]
+        passwords = list(filter(None, map(str.strip, f)))
 
     results = api.analyze_batch(passwords)
     duration = time.time() - start_time
@@ -112,14 +105,12 @@ def example_file_processing():
     print(f"\nCleaned up test file: {test_file}")
 
 
-def example_progress_tracking():
+def example_progress_tracking(api: PassAuditAPI):
     """Example 4: Progress tracking for large batches"""
     print("\n" + "="*60)
     print("Example 4: Progress Tracking")
     print("="*60 + "\n")
 
-    api = PassAuditAPI()
-
     # Generate large test set
     total = 100
     passwords = GeneratePasswords(count=total, length=12)
@@ -127,26 +118,18 @@ def example_progress_tracking():
     print(f"Processing {total} passwords with progress tracking...")
     print("Progress: ", end='', flush=True)
 
-    results = []
-    batch_size = 10
-
-    # Process in batches to show progress
-    for i in range(0, total, batch_size):
-        batch = passwords[i:i+batch_size]
-        batch_results = api.analyze_batch(batch)
-        results.extend(batch_results)
+    def show_progress(done, count):
+        # Print every 10%
+        if done * 10 // count != (done - 1) * 10 // count:
+            print(f"{done / count * 100:.0f}%", end=' ', flush=True)
 
-        # Show progress
-        progress = (i + len(batch)) / total * 100
-        print(f"{progress:.0f}%", end=' ', flush=True)
+    # One batch call, reporting progress as each password completes
+    results = api.analyze_batch(passwords, progress_callback=show_progress)
 
     print("\nProcessing complete!")
 
     # Analyze results
-    strength_categories = {}
-    for result in results:
-        category = result['strength_category']
-        strength_categories[category] = strength_categories.get(category, 0) + 1
+    strength_categories = Counter(result['strength_category'] for result in results)
 
     print("\nStrength Distribution:")
     for category, count in sorted(strength_categories.items()):
@@ -155,14 +138,12 @@ def example_progress_tracking():
         print(f"  {category:15} | {bar:25} {count:3d} ({percentage:.1f}%)")
 
 
-def example_filtering_and_reporting():
+def example_filtering_and_reporting(api: PassAuditAPI):
     """Example 5: Filtering weak passwords and generating report"""
     print("\n" + "="*60)
     print("Example 5: Filtering and Reporting")
     print("="*60 + "\n")
 
-    api = PassAuditAPI()
-
     # Mix of strong and weak passwords
     test_passwords = [
         "password123",
@@ -197,33 +178,33 @@ def example_filtering_and_reporting():
     print(f"{'='*60}")
     for pwd, result in weak_passwords:
         masked = pwd[:2] + '*' * (len(pwd) - 4) + pwd[-2:] if len(pwd) > 4 else '*' * len(pwd)
-        print(f"\n{masked}")
-        print(f"  Score: {result['strength_score']:.1f}/100")
-        print(f"  Issues: ", end='')
+        issues = []
         if result['is_common']:
-            print("Common password ", end='')
+            issues.append("Common password")
         if result['patterns'].get('sequences'):
-            print("Contains sequences ", end='')
+            issues.append("Contains sequences")
         if result['patterns'].get('dates'):
-            print("Contains dates ", end='')
-        print()
+            issues.append("Contains dates")
+
+        # One print per password rather than one per issue
+        print(f"\n{masked}\n  Score: {result['strength_score']:.1f}/100\n  Issues: {' '.join(issues)}")
 
     print(f"\n{'='*60}")
     print(f"STRONG PASSWORDS ({len(strong_passwords)}):")
     print(f"{'='*60}")
-    for pwd, result in strong_passwords:
-        masked = '*' * len(pwd)
-        print(f"{masked:20} | Score: {result['strength_score']:.1f}/100 | [OK] Good")
+    if strong_passwords:
+        print('\n'.join(
+            f"{'*' * len(pwd):20} | Score: {result['strength_score']:.1f}/100 | [OK] Good"
+            for pwd, result in strong_passwords
+        ))
 
 
-def example_performance_comparison():
+def example_performance_comparison(api: PassAuditAPI):
     """Example 6: Compare sequential vs batch performance"""
     print("\n" + "="*60)
     print("Example 6: Performance Comparison")
     print("="*60 + "\n")
 
-    api = PassAuditAPI()
-
     # Generate test set
     test_size = 30
     passwords = GeneratePasswords(count=test_size, length=12)
@@ -236,6 +217,9 @@ def example_performance_comparison():
         seq_results.append(api.analyze_password(pwd))
     seq_time = time.time() - start
 
+    # Analyses are memoized per process, drop them so the batch does the same work
+    clear_analysis_cache()
+
     # Batch processing
     print(f"Testing batch processing ({test_size} passwords)...")
     start = time.time()
@@ -255,12 +239,15 @@ def main():
     print(" "*15 + "PassAudit Batch Processing Examples")
     print("="*70)
 
-    example_sequential_processing()
-    example_batch_processing()
-    example_file_processing()
-    example_progress_tracking()
-    example_filtering_and_reporting()
-    example_performance_comparison()
+    # One API instance is shared by the examples, as an application would
+    api = PassAuditAPI()
+
+    example_sequential_processing(api)
+    example_batch_processing(api)
+    example_file_processing(api)
+    example_progress_tracking(api)
+    example_filtering_and_reporting(api)
+    example_performance_comparison(api)
 
     print("\n" + "="*70)
     print("All examples completed!")
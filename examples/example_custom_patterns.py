@@ -11,7 +11,7 @@ from typing import List, Dict
 # Add parent directory to path to import PassAudit modules
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from analyzer.patterns import DetectPatterns, LoadCommonWords
+from analyzer.patterns import DetectPatterns, FindWords, LoadCommonWords
 from analyzer.strength import CalculateStrength
 
 
@@ -199,7 +199,7 @@ def example_custom_word_check():
     print("Checking passwords against custom word list...")
     for password in test_passwords:
         password_lower = password.lower()
-        found_words = [word for word in all_words if word in password_lower]
+        found_words = FindWords(password_lower, all_words)
 
         print(f"\n{password}")
         if found_words:
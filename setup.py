@@ -1,8 +1,18 @@
+import os
 from setuptools import setup, find_packages
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
+# Optional ahead-of-time compilation of the scoring modules with mypyc:
+#   PASSAUDIT_MYPYC=1 pip install .
+# The compiled extensions take precedence over the .py files at import time,
+# plain installs (or a missing mypy) keep the pure Python modules
+ext_modules = []
+if os.environ.get("PASSAUDIT_MYPYC") == "1":
+    from mypyc.build import mypycify
+    ext_modules = mypycify(["analyzer/strength.py", "analyzer/entropy.py"])
+
 setup(
     name="passaudit",
     version="2.0.0",
@@ -70,6 +80,7 @@ setup(
             "passaudit-web=run_web:main",
         ],
     },
+    ext_modules=ext_modules,
     include_package_data=True,
     package_data={
         "": ["data/*.txt"],
@@ -0,0 +1,61 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from api.core import PassAuditAPI
+
+def test_iter_analyze_matches_batch():
+    """Test streaming analysis yields the batch results in order across chunks"""
+    api = PassAuditAPI({})
+    api.STREAM_CHUNK_SIZE = 2
+    passwords = ["password123", "xK9#mQ2$pL7!", "password123", "qwerty", "abc"]
+
+    stream = api.iter_analyze(iter(passwords))
+    assert next(stream)['password'] == "password123"
+    assert [r['password'] for r in stream] == passwords[1:]
+    assert list(api.iter_analyze(passwords)) == api.analyze_batch(passwords)
+    assert list(api.iter_analyze([])) == []
+
+def test_warmup_loads_common_passwords(monkeypatch):
+    """Test that warmup loads the common passwords set once"""
+    from analyzer import common_passwords
+
+    monkeypatch.setattr(common_passwords, "_COMMON_PASSWORDS", None)
+    PassAuditAPI(config={}).warmup()
+    loaded = common_passwords._COMMON_PASSWORDS
+    assert loaded is not None
+    assert common_passwords.GetCommonPasswords() is loaded
+
+def test_analyze_batch_progress_callback():
+    """Test that progress is reported once per distinct password"""
+    api = PassAuditAPI(config={})
+    passwords = ["password123", "xK9#mQ2$pL7!", "password123", "qwerty"]
+    progress = []
+
+    results = api.analyze_batch(passwords, progress_callback=lambda done, total: progress.append((done, total)))
+    assert progress == [(1, 3), (2, 3), (3, 3)]
+    assert results == api.analyze_batch(passwords)
+
+def test_clear_analysis_cache_drops_passwords():
+    """Test that clear_analysis_cache releases both memoized analyses and patterns"""
+    from api.core import clear_analysis_cache, _analyze_core
+    from analyzer.patterns import _DetectPatternsCached
+
+    api = PassAuditAPI()
+    first = api.analyze_password("Summer2024!")
+    assert _analyze_core.cache_info().currsize > 0
+
+    clear_analysis_cache()
+    assert _analyze_core.cache_info().currsize == 0
+    assert _DetectPatternsCached.cache_info().currsize == 0
+    assert api.analyze_password("Summer2024!") == first
+
+def test_analyze_batch_duplicates_are_independent():
+    """Test that duplicate passwords get results that share no nested lists"""
+    api = PassAuditAPI()
+    results = api.analyze_batch(["password123", "password123", "x"])
+
+    results[0]['feedback'].append("changed")
+    results[0]['patterns']['common_words'].append("changed")
+    assert "changed" not in results[1]['feedback']
+    assert "changed" not in results[1]['patterns']['common_words']
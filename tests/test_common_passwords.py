@@ -29,3 +29,47 @@ def test_common_passwords_loaded():
     assert len(COMMON_PASSWORDS) > 0  # Should have loaded passwords
     assert "password" in COMMON_PASSWORDS
     assert "123456" in COMMON_PASSWORDS
+
+def test_common_passwords_cache_roundtrip(tmp_path):
+    """Test that the pickled cache matches the parsed text list"""
+    import pickle
+    from analyzer.common_passwords import BuildCommonPasswordsCache
+
+    text_file = tmp_path / "common.txt"
+    text_file.write_text("# comment\nPassword\n\n123456\n", encoding="utf-8")
+    cache_file = tmp_path / "common.pkl"
+
+    common_set = BuildCommonPasswordsCache(str(text_file), str(cache_file))
+    assert common_set == frozenset({"password", "123456"})
+
+    with open(cache_file, "rb") as f:
+        assert pickle.load(f) == common_set
+
+    # Only the cache is left behind, no temporary files
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["common.pkl", "common.txt"]
+
+def test_corrupt_cache_is_rebuilt(tmp_path, monkeypatch):
+    """Test that a truncated cache is treated as missing and rebuilt"""
+    import pickle
+    import analyzer.common_passwords as common_passwords
+
+    text_file = tmp_path / "common.txt"
+    text_file.write_text("password\n", encoding="utf-8")
+    cache_file = tmp_path / "common.pkl"
+    cache_file.write_bytes(pickle.dumps(frozenset({"password"}))[:5])
+    monkeypatch.setattr(common_passwords, "GetCommonPasswordsPaths", lambda: (str(text_file), str(cache_file)))
+
+    assert common_passwords.LoadCommonPasswords() == frozenset({"password"})
+    with open(cache_file, "rb") as f:
+        assert pickle.load(f) == frozenset({"password"})
+
+def test_cache_skipped_in_read_only_directory(tmp_path):
+    """Test that an unwritable cache directory still returns the parsed list"""
+    from analyzer.common_passwords import BuildCommonPasswordsCache
+
+    text_file = tmp_path / "common.txt"
+    text_file.write_text("password\n", encoding="utf-8")
+    cache_file = tmp_path / "missing" / "common.pkl"
+
+    assert BuildCommonPasswordsCache(str(text_file), str(cache_file)) == frozenset({"password"})
+    assert not cache_file.parent.exists()
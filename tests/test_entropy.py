@@ -4,10 +4,17 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 from analyzer.entropy import (
     CalculateEntropy,
+    CalculateEntropyBatch,
     CalculateCharacterPoolEntropy,
     GetCharacterPoolSize,
+    GetCharacterClassMask,
+    CLASS_LOWER,
+    CLASS_UPPER,
+    CLASS_DIGIT,
+    CLASS_SYMBOL,
     GetEntropyCategory
 )
+from analyzer.context import BuildAnalysisContext
 
 def test_calculate_entropy_empty():
     """Test entropy calculation with empty password"""
@@ -49,3 +56,24 @@ def test_entropy_category():
     assert GetEntropyCategory(50) == "Moderate"
     assert GetEntropyCategory(35) == "Weak"
     assert GetEntropyCategory(20) == "Very Weak"
+
+def test_calculate_entropy_batch():
+    """Test batch entropy matches the single-password calculation"""
+    passwords = ["aB3$xY9!", "aaa", "", "aB3$xY9!", "password"]
+    assert CalculateEntropyBatch(passwords) == [CalculateEntropy(p) for p in passwords]
+
+def test_character_class_mask():
+    """Test single-pass character class detection"""
+    assert GetCharacterClassMask("") == 0
+    assert GetCharacterClassMask("abc") == CLASS_LOWER
+    assert GetCharacterClassMask("aB1!") == CLASS_LOWER | CLASS_UPPER | CLASS_DIGIT | CLASS_SYMBOL
+    assert GetCharacterClassMask("pass word") == CLASS_LOWER | CLASS_SYMBOL
+    assert GetCharacterClassMask("Ünïcødé9") == CLASS_LOWER | CLASS_UPPER | CLASS_DIGIT
+
+def test_analysis_context_matches_direct_calls():
+    """Analyzers give the same results with or without a shared context"""
+    for password in ["", "a", "Password123!", "aaaaBBBB", "pässwörd", "x" * 300]:
+        context = BuildAnalysisContext(password)
+        assert context.length == len(password)
+        assert CalculateEntropy(password, context) == CalculateEntropy(password)
+        assert CalculateCharacterPoolEntropy(password, context) == CalculateCharacterPoolEntropy(password)
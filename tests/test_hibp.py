@@ -0,0 +1,239 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import analyzer.hibp as hibp
+from analyzer.hibp import HashPassword, HashPasswordBatch, HibpLookupSuffix, CheckHIBPBatch
+
+def test_hash_password_split():
+    """Test SHA-1 prefix/suffix split"""
+    prefix, suffix = HashPassword("password")
+    assert prefix == "5BAA6"
+    assert suffix == "1E4C9B93F3F0682250B6CF8331B7EE68FD8"
+
+def test_hash_password_batch():
+    """Test batch hashing matches single hashing"""
+    passwords = ["password", "", "pässwörd", "password"]
+    assert HashPasswordBatch(passwords) == [HashPassword(p) for p in passwords]
+    assert HashPasswordBatch([]) == []
+
+def test_lookup_suffix():
+    """Test suffix lookup in a parsed range response"""
+    parsed_map = {"ABC": 42}
+    assert HibpLookupSuffix(parsed_map, "ABC") == (True, 42)
+    assert HibpLookupSuffix(parsed_map, "DEF") == (False, 0)
+    assert HibpLookupSuffix(None, "ABC") == (None, 0)
+
+def test_check_hibp_batch_fetches_each_prefix_once(monkeypatch):
+    """Test that batch checks group passwords by hash prefix"""
+    fetched = []
+
+    def fake_fetch(prefix, timeout=5, use_cache=True):
+        fetched.append(prefix)
+        _, suffix = HashPassword("password")
+        return {suffix: 10} if prefix == "5BAA6" else {}
+
+    monkeypatch.setattr(hibp, "HibpPrefixFetch", fake_fetch)
+
+    results = CheckHIBPBatch(["password", "unique-Pa55!", "password"], use_cache=False)
+    assert results == [(True, 10), (False, 0), (True, 10)]
+    assert sorted(fetched) == sorted({"5BAA6", HashPassword("unique-Pa55!")[0]})
+
+def test_check_hibp_memoizes_successful_lookups(monkeypatch):
+    """Test that repeated checks reuse the in-process result and failures are retried"""
+    calls = []
+
+    def fake_fetch(prefix, timeout=5, use_cache=True):
+        calls.append(prefix)
+        return None if len(calls) == 1 else {}
+
+    monkeypatch.setattr(hibp, "HibpPrefixFetch", fake_fetch)
+    hibp.ClearMemoryCache()
+
+    assert hibp.CheckHIBP("memo-test-Pa55") == (None, 0)  # failed, not memoized
+    assert hibp.CheckHIBP("memo-test-Pa55") == (False, 0)
+    assert hibp.CheckHIBP("memo-test-Pa55") == (False, 0)
+    assert len(calls) == 2
+
+    hibp.ClearMemoryCache()
+
+def test_check_hibp_memoized_range_expires(monkeypatch):
+    """Test that memoized ranges are fetched again once the TTL has passed"""
+    calls = []
+    now = [1000.0]
+
+    def fake_fetch(prefix, timeout=5, use_cache=True):
+        calls.append(prefix)
+        return {}
+
+    monkeypatch.setattr(hibp, "HibpPrefixFetch", fake_fetch)
+    monkeypatch.setattr(hibp.time, "time", lambda: now[0])
+    hibp.ClearMemoryCache()
+
+    hibp.CheckHIBP("ttl-test-Pa55")
+    hibp.CheckHIBP("ttl-test-Pa55")
+    assert len(calls) == 1
+
+    now[0] += hibp.HIBP_MEMORY_CACHE_TTL
+    hibp.CheckHIBP("ttl-test-Pa55")
+    assert len(calls) == 2
+
+    hibp.ClearMemoryCache()
+
+def test_prefix_fetch_uses_range_cache(monkeypatch, tmp_path):
+    """Test that range responses are served from the disk cache after the first fetch"""
+    from utils.cache import HIBPCache
+
+    cache = HIBPCache(cache_dir=str(tmp_path))
+    requests_made = []
+
+    def fake_range_fetch(prefix, timeout=5):
+        requests_made.append(prefix)
+        return "0018A45C4D1DEF81644B54AB7F969B88D65:3\r\n00D4F6E8FA6EECAD2A3AA415EEC418D38EC:2"
+
+    monkeypatch.setattr(hibp, "get_cache", lambda: cache)
+    monkeypatch.setattr(hibp, "HibpRangeFetch", fake_range_fetch)
+
+    expected = {"0018A45C4D1DEF81644B54AB7F969B88D65": 3, "00D4F6E8FA6EECAD2A3AA415EEC418D38EC": 2}
+    assert hibp.HibpPrefixFetch("ABCDE") == expected
+    assert hibp.HibpPrefixFetch("ABCDE") == expected
+    assert requests_made == ["ABCDE"]
+
+    assert hibp.HibpPrefixFetch("ABCDE", use_cache=False) == expected
+    assert requests_made == ["ABCDE", "ABCDE"]
+
+def test_cache_get_reads_through_range_table(tmp_path):
+    """Test that per-password cache lookups are answered from the cached range"""
+    import hashlib
+    from utils.cache import HIBPCache
+
+    cache = HIBPCache(cache_dir=str(tmp_path))
+    sha1_hash = hashlib.sha1("password".encode('utf-8')).hexdigest().upper()
+    assert cache.get("password") is None
+
+    cache.set_range(sha1_hash[:5], f"{sha1_hash[5:]}:42\r\n0018A45C4D1DEF81644B54AB7F969B88D65:3")
+    assert cache.get("password") == (True, 42)
+    assert cache.get_stats()['total_entries'] == 1
+
+def test_check_hibp_reuses_range_for_shared_prefix(monkeypatch):
+    """Test that passwords sharing a hash prefix are answered from one range fetch"""
+    calls = []
+
+    def fake_fetch(prefix, timeout=5, use_cache=True):
+        calls.append(prefix)
+        return {"SUFFIXA": 7}
+
+    monkeypatch.setattr(hibp, "HashPassword", lambda password: ("ABCDE", "SUFFIX" + password))
+    monkeypatch.setattr(hibp, "HibpPrefixFetch", fake_fetch)
+    hibp.ClearMemoryCache()
+
+    assert hibp.CheckHIBP("A") == (True, 7)
+    assert hibp.CheckHIBP("B") == (False, 0)
+    assert calls == ["ABCDE"]
+
+    hibp.ClearMemoryCache()
+
+def test_stream_lookup_stops_at_match(monkeypatch):
+    """Test uncached checks stream the range body and stop reading at the matching suffix"""
+    _, suffix = HashPassword("password")
+    lines_read = []
+
+    class FakeResponse:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def raise_for_status(self):
+            pass
+
+        def iter_lines(self):
+            for line in [b"0018A45C4D1DEF81644B54AB7F969B88D65:3", suffix.encode() + b":42", b"FFFF:1"]:
+                lines_read.append(line)
+                yield line
+
+    class FakeSession:
+        def get(self, url, timeout=5, stream=False):
+            assert url.endswith("5BAA6") and stream
+            return FakeResponse()
+
+    monkeypatch.setattr(hibp, "GetSession", lambda: FakeSession())
+
+    assert hibp.CheckHIBP("password", use_cache=False) == (True, 42)
+    assert len(lines_read) == 2
+    assert hibp.HibpStreamLookup("5BAA6", "0" * 35) == (False, 0)
+
+def test_async_batch_matches_sync_analysis(monkeypatch):
+    """Test the async batch path fetches each prefix once and matches the sync results"""
+    import asyncio
+    import api.core_async as core_async
+    from api.core import PassAuditAPI
+
+    fetched = []
+
+    def fake_fetch(prefix, timeout=5, use_cache=True):
+        fetched.append((prefix, use_cache))
+        return {HashPassword("password")[1]: 10} if prefix == "5BAA6" else {}
+
+    monkeypatch.setattr(hibp, "HibpPrefixFetch", fake_fetch)
+
+    api = PassAuditAPI({'security': {'cache_enabled': False, 'hibp_skip_common': False}})
+    passwords = ["password", "unique-Pa55!", "password"]
+    results = asyncio.run(core_async.analyze_batch_async(passwords, check_hibp=True, api=api))
+
+    assert [(r['hibp_pwned'], r['hibp_count']) for r in results] == [(True, 10), (False, 0), (True, 10)]
+    assert sorted(fetched) == sorted({("5BAA6", False), (HashPassword("unique-Pa55!")[0], False)})
+    assert results[1]['strength_score'] == api.analyze_password("unique-Pa55!")['strength_score']
+
+def test_api_skips_hibp_for_common_passwords(monkeypatch):
+    """Test that the API reports common passwords as breached without a HIBP request"""
+    import asyncio
+    import api.core_async as core_async
+    from api.core import PassAuditAPI
+
+    fetched = []
+
+    def fake_fetch(prefix, timeout=5, use_cache=True):
+        fetched.append(prefix)
+        return {}
+
+    monkeypatch.setattr(hibp, "HibpPrefixFetch", fake_fetch)
+
+    api = PassAuditAPI({'security': {'cache_enabled': False}})
+    passwords = ["password", "unique-Pa55!", "password"]
+    expected = [(True, None), (False, 0), (True, None)]
+
+    result = api.analyze_password("password", check_hibp=True)
+    assert (result['hibp_pwned'], result['hibp_count']) == (True, None)
+    assert fetched == []
+
+    results = api.analyze_batch(passwords, check_hibp=True)
+    assert [(r['hibp_pwned'], r['hibp_count']) for r in results] == expected
+    assert fetched == [HashPassword("unique-Pa55!")[0]]
+
+    results = asyncio.run(core_async.analyze_batch_async(passwords, check_hibp=True, api=api))
+    assert [(r['hibp_pwned'], r['hibp_count']) for r in results] == expected
+
+def test_async_batch_filters_candidates_off_the_loop(monkeypatch):
+    """Test that the common password filter runs in a worker thread, not on the event loop"""
+    import asyncio
+    import threading
+    import api.core_async as core_async
+    from api.core import PassAuditAPI
+
+    monkeypatch.setattr(hibp, "HibpPrefixFetch", lambda prefix, timeout=5, use_cache=True: {})
+
+    api = PassAuditAPI({'security': {'cache_enabled': False}})
+    threads = []
+    candidates = api.hibp_candidates
+
+    def recording_candidates(passwords):
+        threads.append(threading.current_thread())
+        return candidates(passwords)
+
+    monkeypatch.setattr(api, "hibp_candidates", recording_candidates)
+    results = asyncio.run(core_async.analyze_batch_async(["password", "unique-Pa55!"], check_hibp=True, api=api))
+
+    assert [(r['hibp_pwned'], r['hibp_count']) for r in results] == [(True, None), (False, 0)]
+    assert threads and threading.main_thread() not in threads
@@ -4,6 +4,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 from analyzer.patterns import (
     DetectPatterns,
+    DetectPatternsBatch,
     DetectSequences,
     DetectKeyboardWalks,
     DetectRepeatedChars,
@@ -19,16 +20,25 @@ def test_detect_sequences():
     assert "abc" in DetectSequences("abc123xyz")
     assert len(DetectSequences("password")) == 0  # No sequences
 
+def test_detect_sequences_descending_and_mixed_case():
+    """Test descending, mixed-case and non-ASCII sequences"""
+    assert DetectSequences("98a7ZyX") == ["ZyX"]
+    assert DetectSequences("x987cBA") == ["987", "cBA"]
+    assert DetectSequences("zyx123") == ["123", "zyx"]
+    assert DetectSequences("é123abc") == ["123", "abc"]
+
 def test_detect_keyboard_walks():
     """Test keyboard walk detection"""
     walks = DetectKeyboardWalks("qwerty123")
     assert len(walks) > 0  # Should detect qwerty
     assert len(DetectKeyboardWalks("randomXyZ")) == 0  # No keyboard walks
+    assert DetectKeyboardWalks("QWERty", "qwerty") == DetectKeyboardWalks("QWERty")
 
 def test_detect_repeated_chars():
     """Test repeated character detection"""
     repeated = DetectRepeatedChars("aaa111bbb")
     assert len(repeated) > 0  # Should detect repeated chars
+    assert DetectRepeatedChars("aaaa-bbb-aaaa") == ["aaaa", "bbb"]
     assert len(DetectRepeatedChars("abc123")) == 0  # No repetitions
 
 def test_detect_date_patterns():
@@ -38,6 +48,7 @@ def test_detect_date_patterns():
     dates = DetectDatePatterns("test2023end")
     assert len(dates) > 0  # Should detect 2023
     assert len(DetectDatePatterns("nodate")) == 0  # No dates
+    assert DetectDatePatterns("password1990") == ["1990"]  # Year not also reported as a day
 
 def test_detect_common_words():
     """Test common word detection"""
@@ -53,6 +64,22 @@ def test_detect_patterns_comprehensive():
     assert len(patterns['sequences']) > 0  # Should detect 123
     assert len(patterns['common_words']) > 0  # Should detect password and qwerty
 
+def test_detect_patterns_batch():
+    """Test batch detection matches single detection, duplicates get their own copy"""
+    passwords = ["password123", "rX9$mK2#pL5", "password123"]
+    results = DetectPatternsBatch(passwords)
+    assert results == [DetectPatterns(p) for p in passwords]
+    assert results[0] is not results[2]
+    assert DetectPatternsBatch([]) == []
+
+def test_detect_patterns_cached_copies():
+    """Test repeated detection returns equal results that callers can modify independently"""
+    first = DetectPatterns("password123")
+    first['sequences'].append("modified")
+    second = DetectPatterns("password123")
+    assert "modified" not in second['sequences']
+    assert second == DetectPatternsBatch(["password123"])[0]
+
 def test_detect_patterns_clean_password():
     """Test pattern detection on clean password"""
     patterns = DetectPatterns("rX9$mK2#pL5")
@@ -183,3 +210,14 @@ def test_comprehensive_new_patterns():
     patterns = DetectPatterns("googlejanuary2023")
     assert len(patterns['context_patterns']) > 0  # google
     assert len(patterns['dates']) > 0  # january, 2023
+
+def test_clear_pattern_cache_drops_passwords():
+    """Test that ClearPatternCache releases memoized passwords without changing results"""
+    from analyzer.patterns import ClearPatternCache, _DetectPatternsCached
+
+    first = DetectPatterns("qwerty2023")
+    assert _DetectPatternsCached.cache_info().currsize > 0
+
+    ClearPatternCache()
+    assert _DetectPatternsCached.cache_info().currsize == 0
+    assert DetectPatterns("qwerty2023") == first
@@ -77,3 +77,30 @@ def test_batch_throughput():
 
     # Should process at least 100 passwords per second
     assert throughput >= 100, f"Throughput too low: {throughput:.1f} passwords/sec"
+
+
+def test_small_batch_stays_serial(monkeypatch):
+    """Test that batches below PARALLEL_THRESHOLD never start a process pool"""
+    import concurrent.futures
+    from Main import AnalyzePasswords
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("process pool started for a small batch")
+
+    monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", no_pool)
+    passwords = ["password123", "qwerty", "password123"] + [f"xK9#mQ2$pL7!{i}" for i in range(10)]
+
+    results = AnalyzePasswords(passwords)
+    assert [r['password'] for r in results] == passwords
+    assert results[0] == results[2] and results[0] is not results[2]
+    assert len(AnalyzePasswords(passwords, max_workers=1)) == len(passwords)
+
+def test_duplicate_results_are_independent():
+    """Test that AnalyzePasswords gives duplicates results that share no nested lists"""
+    from Main import AnalyzePasswords
+
+    results = AnalyzePasswords(["password123", "password123", "x"])
+    results[0]['feedback'].append("changed")
+    results[0]['patterns']['common_words'].append("changed")
+    assert "changed" not in results[1]['feedback']
+    assert "changed" not in results[1]['patterns']['common_words']
@@ -7,7 +7,7 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from analyzer.policy import (
-    PasswordPolicy, get_policy,
+    PasswordPolicy, PolicyRule, get_policy,
     get_basic_policy, get_medium_policy, get_strong_policy, get_enterprise_policy
 )
 
@@ -212,3 +212,51 @@ def test_policy_with_analysis_result():
     # This strong password should pass medium policy
     assert is_valid is True
     assert len(errors) == 0
+
+
+def test_count_rules_match_rule_validators():
+    """Test that count-based rules give the same result through the policy and the rule"""
+    from analyzer.policy import count_characters
+
+    assert count_characters("Pässwörd1!") == (10, 1, 7, 1, 1)
+    assert count_characters("Ab1!") == (4, 1, 1, 1, 1)
+
+    policy = PasswordPolicy("Counts")
+    policy.add_min_length(6).add_max_length(10).require_uppercase(2).require_symbols(1)
+
+    for password in ["AB!abcd", "Ab!", "ABcdefghijk!", "ÄÖ ünïcode"]:
+        is_valid, errors = policy.validate(password)
+        expected = [rule.error_message for rule in policy.rules if not rule.validate(password)[0]]
+        assert errors == expected
+        assert is_valid is (not expected)
+
+
+def test_compiled_policy_tracks_added_rules():
+    """Test that rules added after validation are applied and validator errors are reported"""
+    policy = PasswordPolicy("Compiled").add_min_length(4)
+    assert policy.validate("abcd") == (True, [])
+
+    policy.add_custom_rule("no_a", "Must not contain 'a'", lambda pwd, _: 'a' not in pwd, "Contains 'a'")
+    assert policy.validate("abcd") == (False, ["Contains 'a'"])
+
+    policy.add_custom_rule("broken", "Always raises", lambda pwd, _: 1 / 0, "unused")
+    is_valid, errors = policy.validate("bcde")
+    assert is_valid is False
+    assert errors == ["Validation error: division by zero"]
+
+    # Replacing a rule in place keeps the count but must still recompile
+    policy.rules[2] = PolicyRule("no_b", "Must not contain 'b'", lambda pwd, _: 'b' not in pwd, "Contains 'b'")
+    assert policy.validate("bcde") == (False, ["Contains 'b'"])
+
+
+def test_blacklist_words():
+    """Test blacklisted words are matched case-insensitively for short and long lists"""
+    short_policy = PasswordPolicy("Short").add_blacklist_words(["Acme", "admin"])
+    long_policy = PasswordPolicy("Long").add_blacklist_words(["Acme", "admin", "a.b", "root", "guest"])
+
+    for policy in (short_policy, long_policy):
+        assert policy.validate("MyACME2024!")[0] is False
+        assert policy.validate("Xk9#mQ2!vL7$")[0] is True
+
+    assert long_policy.validate("a.b-secret")[0] is False
+    assert long_policy.validate("axb-secret")[0] is True
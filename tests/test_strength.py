@@ -50,3 +50,31 @@ def test_calculate_strength_empty():
     """Test strength calculation with empty password"""
     score = CalculateStrength("")
     assert score == 0
+
+def test_calculate_strength_long_password_capped():
+    """Test that only the first MAX_ANALYZED_LENGTH characters are scored"""
+    from analyzer.strength import MAX_ANALYZED_LENGTH
+    from analyzer.context import BuildAnalysisContext
+
+    prefix = "xK9#mQ2$pL7!" * 9
+    password = prefix + "a" * 100000
+    expected = CalculateStrength(prefix[:MAX_ANALYZED_LENGTH])
+    assert CalculateStrength(password) == expected
+    assert CalculateStrength(password, context=BuildAnalysisContext(password)) == expected
+
+def test_calculate_strength_with_precomputed_entropy():
+    """Test that passing the entropy gives the same score as calculating it"""
+    from analyzer.entropy import CalculateEntropy
+
+    for password in ["abc", "Password123!", "xK9#mQ2$pL7!"]:
+        entropy = CalculateEntropy(password)
+        assert CalculateStrength(password, entropy=entropy) == CalculateStrength(password)
+
+def test_calculate_pattern_penalty():
+    """Test pattern penalties"""
+    from analyzer.strength import CalculatePatternPenalty
+    from analyzer.patterns import DetectPatterns
+
+    assert CalculatePatternPenalty(DetectPatterns("xK9#mQ2$pL7!")) == 0
+    assert CalculatePatternPenalty({'sequences': [], 'leetspeak': ['p4ss']}) == 6
+    assert CalculatePatternPenalty({'common_words': ['a', 'b', 'c', 'd'], 'keyboard_walks': ['qwerty']}) == 19
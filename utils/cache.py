@@ -31,24 +31,26 @@ class HIBPCache:
         self._initialize_database()
 
     def _initialize_database(self):
-        """Create database table if it doesn't exist"""
+        """Create the range table if it doesn't exist"""
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
 
+        # Per-hash results from older versions, superseded by the range table
+        cursor.execute("DROP TABLE IF EXISTS hibp_cache")
+
+        # Full range responses, keyed by the 5 character hash prefix
         cursor.execute("""
-            CREATE TABLE IF NOT EXISTS hibp_cache (
-                hash_prefix TEXT NOT NULL,
-                hash_suffix TEXT NOT NULL,
-                breach_count INTEGER NOT NULL,
-                timestamp TEXT NOT NULL,
-                PRIMARY KEY (hash_prefix, hash_suffix)
+            CREATE TABLE IF NOT EXISTS hibp_ranges (
+                hash_prefix TEXT PRIMARY KEY,
+                response TEXT NOT NULL,
+                timestamp TEXT NOT NULL
             )
         """)
 
-        # Create index for faster lookups
+        # Create index for faster expiry queries
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_timestamp
-            ON hibp_cache(timestamp)
+            CREATE INDEX IF NOT EXISTS idx_ranges_timestamp
+            ON hibp_ranges(timestamp)
         """)
 
         conn.commit()
@@ -56,28 +58,44 @@ class HIBPCache:
 
     def get(self, password: str) -> Optional[Tuple[bool, int]]:
         """
-        Get cached HIBP result for password
+        Get the cached HIBP result for password from its cached range response
 
         Args:
             password: Password to check
 
         Returns:
-            Tuple of (is_pwned, breach_count) if cached and not expired, None otherwise
+            Tuple of (is_pwned, breach_count) if its range is cached and not expired, None otherwise
         """
-        # Calculate hash
         sha1_hash = hashlib.sha1(password.encode('utf-8')).hexdigest().upper()
-        hash_prefix = sha1_hash[:5]
-        hash_suffix = sha1_hash[5:]
+        response = self.get_range(sha1_hash[:5])
+        if response is None:
+            return None
+
+        from analyzer.hibp import ParseRangeResponse, HibpLookupSuffix
+
+        try:
+            return HibpLookupSuffix(ParseRangeResponse(response), sha1_hash[5:])
+        except ValueError:
+            return None  # Malformed cached response
+
+    def get_range(self, hash_prefix: str) -> Optional[str]:
+        """
+        Get a cached HIBP range response
+
+        Args:
+            hash_prefix: First 5 characters of the uppercase SHA-1 hash
 
+        Returns:
+            Raw range response text if cached and not expired, None otherwise
+        """
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
 
-        # Check cache
         cursor.execute("""
-            SELECT breach_count, timestamp
-            FROM hibp_cache
-            WHERE hash_prefix = ? AND hash_suffix = ?
-        """, (hash_prefix, hash_suffix))
+            SELECT response, timestamp
+            FROM hibp_ranges
+            WHERE hash_prefix = ?
+        """, (hash_prefix,))
 
         result = cursor.fetchone()
         conn.close()
@@ -85,40 +103,31 @@ class HIBPCache:
         if result is None:
             return None
 
-        breach_count, timestamp_str = result
+        response, timestamp_str = result
 
         # Check if expired
         timestamp = datetime.fromisoformat(timestamp_str)
         if datetime.now() - timestamp > timedelta(days=self.expiration_days):
             return None  # Expired
 
-        # Return cached result
-        is_pwned = breach_count > 0
-        return (is_pwned, breach_count)
+        return response
 
-    def set(self, password: str, is_pwned: bool, breach_count: int):
+    def set_range(self, hash_prefix: str, response: str):
         """
-        Cache HIBP result for password
+        Cache a HIBP range response
 
         Args:
-            password: Password that was checked
-            is_pwned: Whether password was found in breaches
-            breach_count: Number of times password was breached
+            hash_prefix: First 5 characters of the uppercase SHA-1 hash
+            response: Raw range response text
         """
-        # Calculate hash
-        sha1_hash = hashlib.sha1(password.encode('utf-8')).hexdigest().upper()
-        hash_prefix = sha1_hash[:5]
-        hash_suffix = sha1_hash[5:]
-
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
 
-        # Insert or replace cache entry
         cursor.execute("""
-            INSERT OR REPLACE INTO hibp_cache
-            (hash_prefix, hash_suffix, breach_count, timestamp)
-            VALUES (?, ?, ?, ?)
-        """, (hash_prefix, hash_suffix, breach_count, datetime.now().isoformat()))
+            INSERT OR REPLACE INTO hibp_ranges
+            (hash_prefix, response, timestamp)
+            VALUES (?, ?, ?)
+        """, (hash_prefix, response, datetime.now().isoformat()))
 
         conn.commit()
         conn.close()
@@ -127,7 +136,7 @@ class HIBPCache:
         """Clear all cache entries"""
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
-        cursor.execute("DELETE FROM hibp_cache")
+        cursor.execute("DELETE FROM hibp_ranges")
         conn.commit()
         conn.close()
 
@@ -139,11 +148,12 @@ class HIBPCache:
         expiration_date = datetime.now() - timedelta(days=self.expiration_days)
 
         cursor.execute("""
-            DELETE FROM hibp_cache
+            DELETE FROM hibp_ranges
             WHERE timestamp < ?
         """, (expiration_date.isoformat(),))
 
         deleted_count = cursor.rowcount
+
         conn.commit()
         conn.close()
 
@@ -159,31 +169,23 @@ class HIBPCache:
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
 
-        # Total entries
-        cursor.execute("SELECT COUNT(*) FROM hibp_cache")
+        # Total entries, one cached range response per hash prefix
+        cursor.execute("SELECT COUNT(*) FROM hibp_ranges")
         total_entries = cursor.fetchone()[0]
 
         # Expired entries
         expiration_date = datetime.now() - timedelta(days=self.expiration_days)
         cursor.execute("""
-            SELECT COUNT(*) FROM hibp_cache
+            SELECT COUNT(*) FROM hibp_ranges
             WHERE timestamp < ?
         """, (expiration_date.isoformat(),))
         expired_entries = cursor.fetchone()[0]
 
-        # Breached entries
-        cursor.execute("""
-            SELECT COUNT(*) FROM hibp_cache
-            WHERE breach_count > 0
-        """)
-        breached_entries = cursor.fetchone()[0]
-
         conn.close()
 
         return {
             'total_entries': total_entries,
             'expired_entries': expired_entries,
-            'breached_entries': breached_entries,
             'active_entries': total_entries - expired_entries
         }
 
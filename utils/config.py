@@ -19,6 +19,8 @@ DEFAULT_CONFIG = {
     "security": {
         "check_hibp": False,
         "hibp_timeout": 5,
+        "hibp_skip_common": True,
+        "hibp_concurrency": 32,
         "cache_enabled": True,
         "cache_expiration_days": 30
     },
@@ -16,6 +16,46 @@ def get_entropy_category(entropy):
     else:
         return 'Very High'
 
+# Pattern keys in the order of their CSV columns
+CSV_PATTERN_KEYS = (
+    'sequences',
+    'keyboard_walks',
+    'repeated_chars',
+    'dates',
+    'common_words',
+    'leetspeak',
+    'context_patterns'
+)
+
+def _CSVRows(results, timestamp, include_hibp):
+    """Yield the CSV row of each result, in ExportToCSV's column order"""
+    for result in results:
+        patterns = result['patterns']
+        row = [
+            result['password'],
+            result['length'],
+            result['strength_score'],
+            result['strength_category'],
+            result['entropy'],
+            result['pool_entropy'],
+            get_entropy_category(result['entropy']),
+            'YES' if result['is_common'] else 'NO'
+        ]
+        row.extend([', '.join(patterns.get(key) or ()) for key in CSV_PATTERN_KEYS])
+        row.append(len(result['feedback']))
+        row.append(timestamp)
+
+        # Add HIBP data if present
+        if include_hibp:
+            if 'hibp_pwned' in result:
+                hibp_count = result['hibp_count']
+                row.append('YES' if result['hibp_pwned'] else 'NO')
+                row.append(hibp_count if hibp_count is not None and hibp_count >= 0 else 'N/A')
+            else:
+                row.extend(('', ''))
+
+        yield row
+
 def ExportToCSV(results, output_path):
     """Export analysis results to CSV file"""
     try:
@@ -41,41 +81,15 @@ def ExportToCSV(results, output_path):
                 'Timestamp'
             ]
 
-            # Add HIBP fields if present
-            if results and 'hibp_pwned' in results[0]:
+            # Add HIBP fields if any result has them
+            include_hibp = any('hibp_pwned' in result for result in results)
+            if include_hibp:
                 fieldnames.extend(['HIBP Pwned', 'HIBP Count'])
 
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-
-            # Write data rows
-            for result in results:
-                row = {
-                    'Password': result['password'],
-                    'Length': result['length'],
-                    'Strength Score': result['strength_score'],
-                    'Strength Category': result['strength_category'],
-                    'Shannon Entropy': result['entropy'],
-                    'Pool Entropy': result['pool_entropy'],
-                    'Entropy Category': get_entropy_category(result['entropy']),
-                    'Is Common': 'YES' if result['is_common'] else 'NO',
-                    'Sequences': ', '.join(result['patterns'].get('sequences', [])) if result['patterns'].get('sequences') else '',
-                    'Keyboard Walks': ', '.join(result['patterns'].get('keyboard_walks', [])) if result['patterns'].get('keyboard_walks') else '',
-                    'Repeated Chars': ', '.join(result['patterns'].get('repeated_chars', [])) if result['patterns'].get('repeated_chars') else '',
-                    'Dates': ', '.join(result['patterns'].get('dates', [])) if result['patterns'].get('dates') else '',
-                    'Common Words': ', '.join(result['patterns'].get('common_words', [])) if result['patterns'].get('common_words') else '',
-                    'Leetspeak': ', '.join(result['patterns'].get('leetspeak', [])) if result['patterns'].get('leetspeak') else '',
-                    'Context Patterns': ', '.join(result['patterns'].get('context_patterns', [])) if result['patterns'].get('context_patterns') else '',
-                    'Feedback Count': len(result['feedback']),
-                    'Timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                }
-
-                # Add HIBP data if present
-                if 'hibp_pwned' in result:
-                    row['HIBP Pwned'] = 'YES' if result['hibp_pwned'] else 'NO'
-                    row['HIBP Count'] = result['hibp_count'] if result['hibp_count'] >= 0 else 'N/A'
-
-                writer.writerow(row)
+            # Rows are lists in header order, written by one writerows call
+            writer = csv.writer(csvfile)
+            writer.writerow(fieldnames)
+            writer.writerows(_CSVRows(results, datetime.now().strftime('%Y-%m-%d %H:%M:%S'), include_hibp))
 
         print(f"\n[SUCCESS] CSV report exported to: {output_path}")
         return True
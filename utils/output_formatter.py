@@ -63,6 +63,9 @@ def DisplaySingleResult(result):
         if result['hibp_count'] == -1:
             print(f"{Fore.YELLOW}HIBP Check: Could not connect to Have I Been Pwned API{Style.RESET_ALL}")
             print()
+        elif result['hibp_count'] is None:
+            print(f"{Fore.RED}{Style.BRIGHT}HIBP ALERT: This common password has been exposed in data breaches!{Style.RESET_ALL}")
+            print()
         elif result['hibp_pwned']:
             print(f"{Fore.RED}{Style.BRIGHT}HIBP ALERT: This password has been exposed in {result['hibp_count']:,} data breaches!{Style.RESET_ALL}")
             print()
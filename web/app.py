@@ -51,6 +51,12 @@ def create_app(config=None):
     def internal_error(error):
         return {'error': 'Internal server error'}, 500
 
+    # Memoized analysis holds plaintext passwords, drop it once each request is done
+    @app.teardown_request
+    def clear_password_caches(exception=None):
+        from api.core import clear_analysis_cache
+        clear_analysis_cache()
+
     # Security headers
     @app.after_request
     def set_security_headers(response):
@@ -3,6 +3,7 @@ Analysis Routes
 Password analysis endpoints and pages
 """
 
+from bisect import bisect_right
 from flask import Blueprint, render_template, request, jsonify, session
 import sys
 import os
@@ -12,6 +13,10 @@ from werkzeug.utils import secure_filename
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 from api import PassAuditAPI
+from analyzer.strength import STRENGTH_THRESHOLDS
+
+# strength_distribution keys, one per STRENGTH_THRESHOLDS bin
+DISTRIBUTION_KEYS = ('very_weak', 'weak', 'medium', 'strong', 'very_strong')
 
 analyze_bp = Blueprint('analyze', __name__)
 api = PassAuditAPI()
@@ -108,18 +113,20 @@ def analyze_batch():
         session.modified = True
 
         # Calculate summary statistics
+        # One pass, each score binned at the 20/40/60/80 category thresholds
         total = len(results)
-        avg_score = sum(r['strength_score'] for r in results) / total
-        weak_count = sum(1 for r in results if r['strength_score'] < 40)
-        common_count = sum(1 for r in results if r['is_common'])
-
-        strength_dist = {
-            'very_weak': sum(1 for r in results if r['strength_score'] < 20),
-            'weak': sum(1 for r in results if 20 <= r['strength_score'] < 40),
-            'medium': sum(1 for r in results if 40 <= r['strength_score'] < 60),
-            'strong': sum(1 for r in results if 60 <= r['strength_score'] < 80),
-            'very_strong': sum(1 for r in results if r['strength_score'] >= 80)
-        }
+        score_total = 0
+        common_count = 0
+        bin_counts = [0] * (len(STRENGTH_THRESHOLDS) + 1)
+        for r in results:
+            score = r['strength_score']
+            score_total += score
+            common_count += r['is_common']
+            bin_counts[bisect_right(STRENGTH_THRESHOLDS, score)] += 1
+
+        avg_score = score_total / total
+        weak_count = bin_counts[0] + bin_counts[1]
+        strength_dist = dict(zip(DISTRIBUTION_KEYS, bin_counts))
 
         response = {
             'success': True,
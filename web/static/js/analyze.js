@@ -212,8 +212,11 @@ document.addEventListener('DOMContentLoaded', function() {
         if (data.hibp_pwned !== undefined) {
             const hibpClass = data.hibp_pwned ? 'danger' : 'success';
             const hibpIcon = data.hibp_pwned ? 'exclamation-triangle-fill' : 'check-circle-fill';
-            const hibpText = data.hibp_pwned ?
-                `Found in ${data.hibp_count.toLocaleString()} breaches!` : 'Not found in breaches';
+            let hibpText = 'Not found in breaches';
+            if (data.hibp_pwned) {
+                hibpText = data.hibp_count === null ?
+                    'Common password, known to be breached!' : `Found in ${data.hibp_count.toLocaleString()} breaches!`;
+            }
 
             html += `
                 <div class="alert alert-${hibpClass}">